@@ -0,0 +1,41 @@
+"""
+Compares the throughput of `BatchingConverter` with calling `western_to_aturan_date` directly from the same number of
+concurrent tasks, for dates and for ISO strings with many repeats.
+
+    $ python benchmarks/bench_aio.py
+"""
+import asyncio
+import datetime
+import time
+
+import aturan_calendar as cal
+
+
+def _rate(run, count):
+    start = time.perf_counter()
+    asyncio.run(run())
+    return count / (time.perf_counter() - start)
+
+
+def main(count=100000):
+    start = datetime.date(2016, 1, 1)
+    days = [start + datetime.timedelta(days=i % 365) for i in range(count)]
+    inputs = [('dates', days), ('ISO strings', ['{}T12:00:00+05:00'.format(day) for day in days])]
+
+    print('{:<14} {:>16} {:>16}'.format('input', 'direct (req/s)', 'batched (req/s)'))
+    for name, values in inputs:
+        async def one(value):
+            return cal.western_to_aturan_date(value)
+
+        async def direct():
+            return await asyncio.gather(*[one(value) for value in values])
+
+        async def batched():
+            converter = cal.BatchingConverter()
+            return await asyncio.gather(*[converter.western_to_aturan_date(value) for value in values])
+
+        print('{:<14} {:>16.0f} {:>16.0f}'.format(name, _rate(direct, count), _rate(batched, count)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Compares sending converted dates as `json.dumps` of the `western_to_aturan` dicts with the encoders in
+`aturan_calendar.encoding`, for a batch of dates.
+
+    $ python benchmarks/bench_encoding.py
+"""
+import datetime
+import json
+import timeit
+
+import aturan_calendar as cal
+from aturan_calendar import encoding
+
+
+def main(count=10000, number=20):
+    first = datetime.date(2000, 1, 1)
+    days = [first + datetime.timedelta(days=n) for n in range(count)]
+    entries = [cal.western_to_aturan(day) for day in days]
+    dates = [cal.western_to_aturan_date(day) for day in days]
+
+    cases = [
+        ('json.dumps(western_to_aturan)', lambda: [json.dumps(cal.western_to_aturan(day)) for day in days]),
+        ('western_to_json', lambda: [encoding.western_to_json(day) for day in days]),
+        ('json.dumps(dict)', lambda: [json.dumps(entry) for entry in entries]),
+        ('to_json(dict)', lambda: [encoding.to_json(entry) for entry in entries]),
+        ('to_json(AturanDate)', lambda: [encoding.to_json(date) for date in dates]),
+        ('json.dumps(list)', lambda: json.dumps(entries)),
+        ('to_json_array', lambda: encoding.to_json_array(dates)),
+        ('to_int', lambda: [encoding.to_int(date) for date in dates]),
+        ('to_bytes', lambda: encoding.to_bytes(dates)),
+    ]
+    print('{:<30} {:>12}'.format('encoder', 'ns/date'))
+    for name, encode in cases:
+        seconds = min(timeit.repeat(encode, number=number, repeat=3)) / number
+        print('{:<30} {:>12.1f}'.format(name, seconds / count * 1e9))
+
+    text = encoding.to_json_array(dates)
+    data = encoding.to_bytes(dates)
+    print()
+    print('JSON is {:.1f} and bytes are {:.1f} bytes per date'.format(len(text) / count, len(data) / count))
+    print()
+    print('{:<30} {:>12}'.format('decoder', 'ns/date'))
+    for name, decode in (('json.loads', lambda: json.loads(text)),
+                         ('from_json', lambda: encoding.from_json(text)),
+                         ('from_bytes', lambda: encoding.from_bytes(data))):
+        seconds = min(timeit.repeat(decode, number=number, repeat=3)) / number
+        print('{:<30} {:>12.1f}'.format(name, seconds / count * 1e9))
+
+if __name__ == '__main__':
+    main()
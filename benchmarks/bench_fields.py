@@ -0,0 +1,103 @@
+"""
+Compares building the Aturan fields of a date through the original chain of per-field functions, each normalizing
+the day of the year again, with the single divmod and precomputed entry used now. Reports the time per conversion and
+the number of Python function calls each one makes.
+
+    $ python benchmarks/bench_fields.py
+"""
+import datetime
+import sys
+import timeit
+
+import aturan_calendar as cal
+from aturan_calendar.core import _ORIGIN_ORDINAL, _ORIGIN_YEAR, _ordinal_to_aturan
+
+
+# The per-field functions as they were before the day table, each one normalizing the day of the year itself.
+def _normalize_doy(days):
+    return days - (((days - 1) // cal.ATURAN_DAYS_IN_YEAR) * cal.ATURAN_DAYS_IN_YEAR)
+
+
+def _day_of_span(doy):
+    dos = _normalize_doy(doy) % cal.ATURAN_DAYS_IN_SPAN
+    return cal.ATURAN_DAYS_IN_SPAN if dos == 0 else dos
+
+
+def _day_of_month(doy):
+    ndoy = _normalize_doy(doy)
+    return ndoy - (((ndoy - 1) // cal.ATURAN_DAYS_IN_MONTH) * cal.ATURAN_DAYS_IN_MONTH)
+
+
+def _month_of_year_name(doy):
+    ndoy = _normalize_doy(doy)
+    if ndoy >= cal.ATURAN_FIRST_HOLY_DAY:
+        return None
+    return cal.ATURAN_MONTH_OF_YEAR_NAMES[((ndoy - 1) // cal.ATURAN_DAYS_IN_MONTH) + 1]
+
+
+def _span_of_month_num(doy):
+    if _normalize_doy(doy) >= cal.ATURAN_FIRST_HOLY_DAY:
+        return None
+    return ((_day_of_month(doy) - 1) // cal.ATURAN_DAYS_IN_SPAN) + 1
+
+
+def _day_of_span_name(doy):
+    ndoy = _normalize_doy(doy)
+    n = _day_of_span(doy)
+    if ndoy >= cal.ATURAN_FIRST_HOLY_DAY:
+        day = 'High Mourning Day #{}'.format(ndoy - (cal.ATURAN_FIRST_HOLY_DAY - 1))
+        if ndoy == cal.ATURAN_WINTERS_SOLSTICE_DAY:
+            day += ' (Winter\'s Solstice)'
+        return day
+    return cal.ATURAN_DAY_NAMES[n]
+
+
+def _day_of_month_num(doy):
+    if _normalize_doy(doy) >= cal.ATURAN_FIRST_HOLY_DAY:
+        return None
+    return _day_of_month(doy)
+
+
+def chained_ordinal_to_aturan(ordinal):
+    days = ordinal - _ORIGIN_ORDINAL
+    ndoy = _normalize_doy(days)
+    return {
+        'day_of_year': ndoy,
+        'month_of_year': _month_of_year_name(ndoy),
+        'span_of_month': _span_of_month_num(ndoy),
+        'day_of_span': _day_of_span_name(ndoy),
+        'day_of_month': _day_of_month_num(ndoy),
+        'year': (_ORIGIN_YEAR + 1) + ((days - 1) // cal.ATURAN_DAYS_IN_YEAR),
+    }
+
+
+def _calls(func, arg):
+    calls = []
+
+    def profile(frame, event, _):
+        if event == 'call':
+            calls.append(frame.f_code.co_name)
+
+    sys.setprofile(profile)
+    try:
+        func(arg)
+    finally:
+        sys.setprofile(None)
+    # The call into `func` itself is not counted.
+    return len(calls) - 1
+
+
+def main(number=200000):
+    first = datetime.date(2016, 1, 1).toordinal()
+    for ordinal in range(first, first + cal.ATURAN_DAYS_IN_YEAR):
+        assert chained_ordinal_to_aturan(ordinal) == _ordinal_to_aturan(ordinal)
+
+    ordinal = datetime.date(2016, 4, 14).toordinal()
+    print('{:<12} {:>10} {:>8}'.format('fields', 'ns/call', 'calls'))
+    for name, func in (('chained', chained_ordinal_to_aturan), ('fused', _ordinal_to_aturan)):
+        seconds = min(timeit.repeat(lambda: func(ordinal), number=number, repeat=5)) / number
+        print('{:<12} {:>10.1f} {:>8}'.format(name, seconds * 1e9, _calls(func, ordinal)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+"""
+Compares the memory held by a year of `western_to_aturan` dicts against the same year of `AturanDate` objects.
+
+    $ python benchmarks/bench_memory.py
+"""
+import datetime
+import tracemalloc
+
+import aturan_calendar as cal
+
+
+def _measure(convert, days, users):
+    tracemalloc.start()
+    held = [[convert(day) for day in days] for _ in range(users)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return size
+
+
+def main(users=200):
+    start = datetime.date(2016, 1, 1)
+    days = [start + datetime.timedelta(days=i) for i in range(366)]
+    count = len(days) * users
+
+    print('{:<24} {:>12} {:>14}'.format('holding {} results'.format(count), 'total (KiB)', 'per result (B)'))
+    for name, convert in (('dict', cal.western_to_aturan), ('AturanDate', cal.western_to_aturan_date)):
+        size = _measure(convert, days, users)
+        print('{:<24} {:>12.0f} {:>14.1f}'.format(name, size / 1024, size / count))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+"""
+Compares the `.aturan` pandas accessor against `Series.apply(western_to_aturan)`.
+
+    $ python benchmarks/bench_pandas.py
+"""
+import time
+
+import pandas as pd
+
+import aturan_calendar as cal
+import aturan_calendar.pandas_accessor  # noqa
+
+
+def _time(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(rows=200000):
+    series = pd.Series(pd.date_range('1800-01-01', periods=rows, freq='D'))
+
+    applied = _time(lambda: series.apply(cal.western_to_aturan))
+    # A fresh Series each time, since pandas caches the accessor and its results on the Series.
+    accessor = _time(lambda: series.copy().aturan.to_frame())
+
+    print('{} rows'.format(rows))
+    print('    apply(western_to_aturan) {:>8.3f}s'.format(applied))
+    print('    .aturan.to_frame()       {:>8.3f}s {:>8.1f}x'.format(accessor, applied / accessor))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""
+Shows how `convert_parallel` scales with the number of worker processes. Only splitting the input and joining the
+result columns happens in the parent, so the speedup should follow the number of CPUs.
+
+    $ python benchmarks/bench_parallel.py
+"""
+import datetime
+import os
+import time
+
+import aturan_calendar as cal
+
+
+def _time(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(count=2000000):
+    start = datetime.date(1600, 1, 1)
+    dates = [start + datetime.timedelta(days=i % 292000) for i in range(count)]
+    inputs = [('list of dates', dates), ('list of ISO strings', [day.isoformat() for day in dates])]
+    try:
+        import numpy as np
+        inputs.append(('datetime64 array', np.array(dates, dtype='datetime64[D]').repeat(10)))
+    except ImportError:
+        pass
+
+    workers = [1, 2, 4, 8]
+    workers = [w for w in workers if w <= (os.cpu_count() or 1)] or [1]
+
+    for name, values in inputs:
+        serial = _time(lambda: cal.convert_parallel(values, chunksize=len(values)))
+        print('{} ({} dates): single process {:.2f}s'.format(name, len(values), serial))
+        for max_workers in workers:
+            chunksize = max(1, len(values) // (max_workers * 4))
+            seconds = _time(lambda: cal.convert_parallel(values, max_workers=max_workers, chunksize=chunksize))
+            print('    {:>2} workers {:>8.2f}s {:>6.2f}x'.format(max_workers, seconds, serial / seconds))
+
+
+if __name__ == '__main__':
+    main()
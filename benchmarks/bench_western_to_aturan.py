@@ -0,0 +1,46 @@
+"""
+Compares the ordinal based `western_to_aturan` against the previous Arrow based normalization.
+
+    $ python benchmarks/bench_western_to_aturan.py
+"""
+import datetime
+import timeit
+
+import arrow
+
+import aturan_calendar as cal
+from aturan_calendar import core
+
+
+def arrow_western_to_aturan(dateish):
+    # Normalizes through Arrow the way `western_to_aturan` did before dates became ordinals. The entry is still built
+    # by the current core helpers, so only the normalization differs.
+    if isinstance(dateish, datetime.date):
+        normalized = arrow.Arrow.fromdate(dateish)
+    elif isinstance(dateish, arrow.Arrow):
+        normalized = dateish.floor('day')
+    else:
+        raise TypeError
+    days = (normalized - cal._ORIGIN).days
+    entry = core._create_entry(days)
+    entry['year'] = core._get_aturan_year(days)
+    return entry
+
+
+def main(number=20000):
+    inputs = [
+        ('date', datetime.date(2016, 4, 14)),
+        ('datetime', datetime.datetime(2016, 4, 14, 13, 37)),
+        ('arrow', arrow.get(2016, 4, 14, 13, 37)),
+    ]
+
+    print('{:<10} {:>14} {:>14} {:>9}'.format('input', 'arrow (us)', 'ordinal (us)', 'speedup'))
+    for name, value in inputs:
+        assert arrow_western_to_aturan(value) == cal.western_to_aturan(value)
+        old = min(timeit.repeat(lambda: arrow_western_to_aturan(value), number=number, repeat=3)) / number
+        new = min(timeit.repeat(lambda: cal.western_to_aturan(value), number=number, repeat=3)) / number
+        print('{:<10} {:>14.3f} {:>14.3f} {:>8.1f}x'.format(name, old * 1e6, new * 1e6, old / new))
+
+
+if __name__ == '__main__':
+    main()
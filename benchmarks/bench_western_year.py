@@ -0,0 +1,44 @@
+"""
+Compares building a Western year of Aturan dates with Arrow, as a dict of dicts, and as array backed columns.
+
+    $ python benchmarks/bench_western_year.py
+"""
+import timeit
+import tracemalloc
+
+import arrow
+
+import aturan_calendar as cal
+
+
+def arrow_calendar_for_western_year(year):
+    # `aturan_calendar_for_western_year` as it used to be, stepping through the year one Arrow object per day.
+    year_begin = arrow.get(year, 1, 1)
+    year_end = year_begin.shift(years=+1, days=-1)
+    return {idx: cal.western_to_aturan(day) for idx, day in enumerate(arrow.Arrow.range('day', year_begin, year_end), 1)}
+
+
+def _memory(build):
+    tracemalloc.start()
+    held = build(2016)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return size
+
+
+def main(number=50):
+    builders = [
+        ('arrow dict of dicts', arrow_calendar_for_western_year),
+        ('dict of dicts', cal.aturan_calendar_for_western_year),
+        ('columns', cal.western_year_calendar),
+    ]
+
+    print('{:<22} {:>10} {:>12}'.format('builder', 'time (ms)', 'memory (KiB)'))
+    for name, build in builders:
+        seconds = min(timeit.repeat(lambda: build(2016), number=number, repeat=3)) / number
+        print('{:<22} {:>10.3f} {:>12.1f}'.format(name, seconds * 1e3, _memory(build) / 1024))
+
+
+if __name__ == '__main__':
+    main()
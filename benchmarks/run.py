@@ -0,0 +1,110 @@
+"""
+Benchmarks every public conversion function and compares the results against a stored baseline.
+
+    $ python benchmarks/run.py                  # compare against benchmarks/baseline.json
+    $ python benchmarks/run.py --save           # record a new baseline
+    $ python benchmarks/run.py --threshold 1.25 # fail on anything 25% slower than the baseline (default is 2x)
+
+Timings are the best of several repeats, in microseconds per call. Baselines are machine specific, so record a new
+one before comparing on different hardware.
+"""
+import argparse
+import datetime
+import json
+import os
+import sys
+import timeit
+
+import arrow
+
+import aturan_calendar as cal
+from aturan_calendar import encoding, render
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+DATE = datetime.date(2016, 4, 14)
+DATETIME = datetime.datetime(2016, 4, 14, 13, 37)
+ARROW = arrow.get(2016, 4, 14, 13, 37)
+
+BENCHMARKS = {
+    'western_to_aturan[date]': lambda: cal.western_to_aturan(DATE),
+    'western_to_aturan[datetime]': lambda: cal.western_to_aturan(DATETIME),
+    'western_to_aturan[arrow]': lambda: cal.western_to_aturan(ARROW),
+    'western_to_aturan[iso string]': lambda: cal.western_to_aturan('2016-04-14'),
+    'western_to_aturan[epoch seconds]': lambda: cal.western_to_aturan(1460641020),
+    'western_to_aturan[epoch seconds, tz]': lambda: cal.western_to_aturan(1460641020, tz='America/New_York'),
+    'western_to_aturan_date[date]': lambda: cal.western_to_aturan_date(DATE),
+    'json.dumps(western_to_aturan)': lambda: json.dumps(cal.western_to_aturan(DATE)),
+    'encoding.western_to_json': lambda: encoding.western_to_json(DATE),
+    'full_calendar': cal.full_calendar,
+    'full_calendar[copy]': lambda: cal.full_calendar(copy=True),
+    'aturan_calendar_for_western_year': lambda: cal.aturan_calendar_for_western_year(2016),
+    'western_year_calendar': lambda: cal.western_year_calendar(2016),
+    'aturan_to_western': lambda: cal.aturan_to_western(2016, 303),
+    'aturan_year_bounds': lambda: cal.aturan_year_bounds(2016),
+    'render.text_month': lambda: render.text_month(2016, 'Reaping'),
+    'render.html_year': lambda: render.html_year(2016),
+    'render.holy_days_ics': lambda: render.holy_days_ics(2016),
+    'month_of_year': lambda: cal.month_of_year(303),
+    'day_of_span': lambda: cal.day_of_span(303),
+    'day_of_month': lambda: cal.day_of_month(303),
+    'span_of_month': lambda: cal.span_of_month(303),
+    'month_of_year_name': lambda: cal.month_of_year_name(303),
+    'day_of_span_name': lambda: cal.day_of_span_name(303),
+    'day_of_month_num': lambda: cal.day_of_month_num(303),
+    'span_of_month_num': lambda: cal.span_of_month_num(303),
+}
+
+
+def measure(func, repeat=9):
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--save', action='store_true', help='store the results as the new baseline')
+    parser.add_argument('--baseline', default=BASELINE, help='baseline file (default: %(default)s)')
+    parser.add_argument('--threshold', type=float, default=2.0,
+                        help='fail when a benchmark is this many times slower than its baseline (default: %(default)s)')
+    parser.add_argument('names', nargs='*', help='only run these benchmarks')
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results = {}
+    regressions = []
+    print('{:<36} {:>12} {:>12} {:>8}'.format('benchmark', 'us/call', 'baseline', 'ratio'))
+    for name, func in BENCHMARKS.items():
+        if args.names and name not in args.names:
+            continue
+        results[name] = measure(func)
+
+        if name in baseline:
+            ratio = results[name] / baseline[name]
+            print('{:<36} {:>12.3f} {:>12.3f} {:>7.2f}x'.format(name, results[name], baseline[name], ratio))
+            if ratio > args.threshold:
+                regressions.append(name)
+        else:
+            print('{:<36} {:>12.3f} {:>12} {:>8}'.format(name, results[name], '-', '-'))
+
+    if args.save:
+        baseline.update(results)
+        with open(args.baseline, 'w') as f:
+            json.dump({k: round(v, 4) for k, v in baseline.items()}, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print('saved baseline to {}'.format(args.baseline))
+        return 0
+
+    if regressions:
+        print('slower than {}x the baseline: {}'.format(args.threshold, ', '.join(regressions)))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
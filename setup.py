@@ -27,6 +27,12 @@ REQUIRED = [
     'arrow'
 ]
 
+# What packages are optional?
+EXTRAS = {
+    'numpy': ['numpy'],
+    'pandas': ['numpy', 'pandas'],
+}
+
 # The rest you shouldn't have to touch too much :)
 # ------------------------------------------------
 # Except, perhaps the License and Trove Classifiers!
@@ -103,10 +109,11 @@ setup(
     # If your package is a single module, use this instead of 'packages':
     # py_modules=['mypackage'],
 
-    # entry_points={
-    #     'console_scripts': ['mycli=mymodule:cli'],
-    # },
+    entry_points={
+        'console_scripts': ['aturan-calendar=aturan_calendar.cli:main'],
+    },
     install_requires=REQUIRED,
+    extras_require=EXTRAS,
     include_package_data=True,
     license='MIT',
     classifiers=[
@@ -35,5 +35,28 @@ As mentioned above, some of this is just guesswork. If `Day 3` gives better insi
 
 """  # noqa
 
+import importlib
+
 from .core import *  # noqa
-from .core import _ORIGIN  # noqa
+from .cache import ConversionCache  # noqa
+from . import core as _core
+
+# Keep `import aturan_calendar` cheap: these pull in arrow, numpy, asyncio, or concurrent.futures, so they are only
+# imported the first time they are used.
+_LAZY = {
+    'BatchingConverter': 'aio',
+    'ConversionTable': 'table_file',
+    'write_table': 'table_file',
+    'aturan_to_western_array': 'arrays',
+    'western_to_aturan_array': 'arrays',
+    'ConvertedDates': 'parallel',
+    'convert_parallel': 'parallel',
+}
+
+
+def __getattr__(name):
+    if name == '_ORIGIN':
+        return _core._ORIGIN
+    if name in _LAZY:
+        return getattr(importlib.import_module('.' + _LAZY[name], __name__), name)
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
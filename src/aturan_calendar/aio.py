@@ -0,0 +1,147 @@
+"""
+An asyncio facade that batches conversion requests arriving close together.
+
+Waiting for a batch costs each caller a trip through the event loop, which is more than a conversion itself, so this is
+not a way to convert faster: `benchmarks/bench_aio.py` gets about 40% fewer requests per second than calling
+`western_to_aturan_date` directly from the same tasks. What it gives is one conversion per distinct input per batch and
+`stats` on the traffic. A NumPy path for the batch was measured and was no faster than converting the few hundred
+distinct ordinals of a batch one by one.
+"""
+import asyncio
+import threading
+import time
+
+from .core import _normalize_date, _ordinal_to_date
+
+
+class _Batch:
+    # The requests waiting on one event loop, keyed by input so that each distinct one is converted once, and the
+    # timer that will convert them.
+    __slots__ = ('requests', 'size', 'handle')
+
+    def __init__(self):
+        self.requests = {}
+        self.size = 0
+        self.handle = None
+
+
+class BatchingConverter:
+    """
+    Collects the conversion requests made within `window` seconds of each other and converts them in one batch,
+        normalizing and converting each distinct input only once, then resolves every waiting caller. One converter can
+        serve several event loops, e.g. one per thread; each loop gets its own batches and timer.
+
+    :param window: Float, the number of seconds to wait for more requests after the first one of a batch.
+    :param max_batch: Integer, the batch is converted right away once this many requests are waiting.
+    """
+
+    def __init__(self, window=0.001, max_batch=1024):
+        self.window = window
+        self.max_batch = max_batch
+        self._batches = {}
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._requests = 0
+        self._batches_done = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+    def _batch(self, loop):
+        batch = self._batches.get(loop)
+        if batch is None:
+            # Loops that have been closed will never convert what they left behind, so they are forgotten here.
+            for other in list(self._batches):
+                if other.is_closed():
+                    self._batches.pop(other, None)
+            batch = self._batches[loop] = _Batch()
+        return batch
+
+    async def western_to_aturan_date(self, dateish):
+        """
+        Returns the Aturan date for a given Western/Gregorian date once its batch has been converted. Inputs that cannot
+            be converted raise the same TypeError or ValueError as `western_to_aturan_date`.
+
+        :param dateish: datetime.Date, datetime.DateTime, Arrow, ISO 8601 String, or Unix timestamp in seconds. The date
+            for which you want the Aturan equivalent.
+        :return: :AturanDate:
+        """
+        loop = asyncio.get_running_loop()
+        batch = self._batch(loop)
+        future = loop.create_future()
+        # The type is part of the key, so that e.g. 1 and True are not taken for the same input.
+        key = (dateish.__class__, dateish)
+        waiters = batch.requests.get(key)
+        if waiters is None:
+            waiters = batch.requests[key] = []
+        waiters.append((future, loop.time()))
+        batch.size += 1
+
+        if batch.size >= self.max_batch:
+            self._flush(batch)
+        elif batch.handle is None:
+            batch.handle = loop.call_later(self.window, self._flush, batch)
+        return await future
+
+    def _flush(self, batch):
+        if batch.handle is not None:
+            batch.handle.cancel()
+            batch.handle = None
+        requests, batch.requests = batch.requests, {}
+        batch.size = 0
+
+        answered = 0
+        total_latency = max_latency = 0.0
+        now = asyncio.get_running_loop().time()
+        for (_, dateish), waiters in requests.items():
+            # Callers that were cancelled while waiting are dropped rather than converted.
+            waiters = [(future, queued) for future, queued in waiters if not future.done()]
+            if not waiters:
+                continue
+            try:
+                date = _ordinal_to_date(_normalize_date(dateish))
+            except (TypeError, ValueError) as e:
+                for future, _ in waiters:
+                    future.set_exception(e)
+            else:
+                for future, _ in waiters:
+                    future.set_result(date)
+            for _, queued in waiters:
+                latency = now - queued
+                total_latency += latency
+                max_latency = max(max_latency, latency)
+            answered += len(waiters)
+
+        if answered:
+            with self._lock:
+                self._requests += answered
+                self._batches_done += 1
+                self._total_latency += total_latency
+                self._max_latency = max(self._max_latency, max_latency)
+
+    def stats(self):
+        """
+        :return: :dict:, keys are 'requests', 'batches', 'pending', 'mean_batch_size', 'mean_latency', 'max_latency',
+            'requests_per_second', and 'batches_per_second'. Latencies are in seconds, from the request being queued to
+            its batch being converted. Rates are averaged over the lifetime of the converter.
+        """
+        pending = sum(
+            1
+            for batch in list(self._batches.values())
+            for waiters in list(batch.requests.values())
+            for future, _ in waiters
+            if not future.done()
+        )
+        with self._lock:
+            requests, batches = self._requests, self._batches_done
+            total_latency, max_latency = self._total_latency, self._max_latency
+        elapsed = time.monotonic() - self._started
+        return {
+            'requests': requests,
+            'batches': batches,
+            'pending': pending,
+            'mean_batch_size': requests / batches if batches else 0.0,
+            'mean_latency': total_latency / requests if requests else 0.0,
+            'max_latency': max_latency,
+            'requests_per_second': requests / elapsed if elapsed else 0.0,
+            'batches_per_second': batches / elapsed if elapsed else 0.0,
+        }
@@ -0,0 +1,94 @@
+"""
+Vectorized conversions over NumPy arrays. Requires the optional `numpy` dependency.
+"""
+import numpy as np
+
+from .core import (
+    ATURAN_DAYS_IN_MONTH,
+    ATURAN_DAYS_IN_SPAN,
+    ATURAN_DAYS_IN_YEAR,
+    ATURAN_FIRST_HOLY_DAY,
+    _ORIGIN_ORDINAL,
+    _ORIGIN_YEAR,
+    _UNIX_EPOCH_ORDINAL,
+    _normalize_date,
+)
+
+
+def _to_ordinals(dates, tz=None):
+    values = np.asarray(dates)
+
+    if values.dtype == object:
+        if tz is not None:
+            from .timezones import local_ordinal
+            return np.fromiter((local_ordinal(value, tz) for value in values.ravel()), np.int64,
+                               values.size).reshape(values.shape)
+        # Each object gets the date `western_to_aturan` would give it, e.g. the local date of an aware datetime, where
+        # NumPy would take the UTC one. Anything else, such as None or datetime64 scalars, is left to NumPy.
+        try:
+            return np.fromiter(map(_normalize_date, values.ravel()), np.int64, values.size).reshape(values.shape)
+        except TypeError:
+            values = values.astype('datetime64[D]')
+
+    if np.issubdtype(values.dtype, np.datetime64):
+        if np.isnat(values).any():
+            raise ValueError('dates must not contain NaT, drop or fill missing values first')
+        if tz is not None:
+            from .timezones import local_days
+            return local_days(values.astype('datetime64[s]').astype(np.int64), tz)
+        return values.astype('datetime64[D]').astype(np.int64) + _UNIX_EPOCH_ORDINAL
+
+    if np.issubdtype(values.dtype, np.integer):
+        return values.astype(np.int64)
+
+    raise TypeError
+
+
+def western_to_aturan_array(dates, tz=None):
+    """
+    Returns the Aturan date information for many Western/Gregorian dates at once. There is no Aturan date for a
+        missing value, so NaT raises ValueError; drop or fill missing values first.
+
+    :param dates: NumPy `datetime64` array (any unit, floored to the day), integer array of proleptic Gregorian
+        ordinals (see `datetime.date.toordinal`), or a sequence of `datetime.date` objects. Objects are taken the same
+        way `western_to_aturan` takes them, so an aware datetime falls on its own local date.
+    :param tz: String or datetime.tzinfo, optional. A time zone such as 'America/New_York'. `datetime64` values are
+        taken as UTC instants and converted to the day they fall on in this zone.
+    :return: :dict: of :numpy.ndarray:, keys are 'year', 'day_of_year', 'month_of_year', 'span_of_month',
+        'day_of_span', and 'day_of_month'. Values are numeric, i.e. `month_of_year` is 1-8 and `day_of_span` is 1-11.
+        The High Mourning Holy Days are not part of a month, so their `month_of_year`, `span_of_month`, and
+        `day_of_month` are 0 and their `day_of_span` is the number of the Holy Day (1-7).
+    """
+    days = _to_ordinals(dates, tz) - _ORIGIN_ORDINAL
+    years, doy = np.divmod(days - 1, ATURAN_DAYS_IN_YEAR)
+    month_idx, dom = np.divmod(doy, ATURAN_DAYS_IN_MONTH)
+    span_idx = dom // ATURAN_DAYS_IN_SPAN
+    dos = doy % ATURAN_DAYS_IN_SPAN
+    doy += 1
+
+    regular = doy < ATURAN_FIRST_HOLY_DAY
+    return {
+        'year': years + (_ORIGIN_YEAR + 1),
+        'day_of_year': doy.astype(np.int16),
+        'month_of_year': np.where(regular, month_idx + 1, 0).astype(np.int16),
+        'span_of_month': np.where(regular, span_idx + 1, 0).astype(np.int16),
+        'day_of_span': (dos + 1).astype(np.int16),
+        'day_of_month': np.where(regular, dom + 1, 0).astype(np.int16),
+    }
+
+
+def aturan_to_western_array(years, days_of_year):
+    """
+    Returns the Western/Gregorian dates for many Aturan dates at once.
+
+    :param years: Integer array (or scalar), the Aturan years.
+    :param days_of_year: Integer array (or scalar), the Aturan days of the year (1-359).
+    :return: :numpy.ndarray: of `datetime64[D]`
+    """
+    years = np.asarray(years, dtype=np.int64)
+    days_of_year = np.asarray(days_of_year, dtype=np.int64)
+    if ((days_of_year < 1) | (days_of_year > ATURAN_DAYS_IN_YEAR)).any():
+        raise ValueError('days_of_year must be between 1 and {}'.format(ATURAN_DAYS_IN_YEAR))
+
+    ordinals = _ORIGIN_ORDINAL + (years - (_ORIGIN_YEAR + 1)) * ATURAN_DAYS_IN_YEAR + days_of_year
+    return (ordinals - _UNIX_EPOCH_ORDINAL).astype('datetime64[D]')
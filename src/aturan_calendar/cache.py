@@ -0,0 +1,49 @@
+"""
+Optional memoization for workloads that convert the same few dates over and over.
+"""
+import functools
+
+from .core import _normalize_date, _ordinal_to_date
+
+
+class ConversionCache:
+    """
+    A bounded LRU cache of conversions, keyed by the proleptic Gregorian ordinal of the date so that a date, a datetime
+        and an Arrow for the same day share one entry. Cached values are immutable `AturanDate` objects, so they are
+        safe to hand to every caller. Backed by `functools.lru_cache`, which is safe to share between threads.
+
+    :param maxsize: Integer, the number of conversions to keep before the least recently used is evicted. None keeps
+        every conversion.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._lookup = functools.lru_cache(maxsize=maxsize)(_ordinal_to_date)
+
+    def western_to_aturan_date(self, dateish):
+        """
+        Returns the, possibly cached, Aturan date for a given Western/Gregorian date.
+
+        :param dateish: datetime.Date, datetime.DateTime, Arrow, ISO 8601 String, or Unix timestamp in seconds. The date
+            for which you want the Aturan equivalent.
+        :return: :AturanDate:
+        """
+        return self._lookup(_normalize_date(dateish))
+
+    def stats(self):
+        """
+        :return: :dict:, keys are 'hits', 'misses', 'size', and 'maxsize'. Counters restart when the cache is cleared.
+        """
+        info = self._lookup.cache_info()
+        return {
+            'hits': info.hits,
+            'misses': info.misses,
+            'size': info.currsize,
+            'maxsize': info.maxsize,
+        }
+
+    def clear(self):
+        """
+        Drops every cached conversion and resets the counters.
+        """
+        self._lookup.cache_clear()
@@ -0,0 +1,148 @@
+"""
+Command line converter. Reads ISO dates, one per line or from a CSV column, and writes their Aturan equivalents as
+CSV or JSON Lines.
+
+    $ aturan-calendar < dates.txt > aturan.csv
+    $ aturan-calendar --column created_at --format jsonl events.csv
+"""
+import argparse
+import csv
+import functools
+import itertools
+import json
+import sys
+
+from .core import _ENTRY_TABLE, _normalize_date, _ordinal_to_date
+from .encoding import _JSON_FRAGMENTS
+
+_FIELDS = tuple(_ENTRY_TABLE[0]) + ('year',)
+_CHUNK_LINES = 10000
+_BUFFER_SIZE = 1 << 20
+
+
+def _csv_field(value):
+    # The quoting `csv.writer` does by default, for text that may hold a comma or a quote, e.g. '08:00:00,5'.
+    text = '' if value is None else str(value)
+    if any(char in text for char in ',"\r\n'):
+        return '"{}"'.format(text.replace('"', '""'))
+    return text
+
+
+def _csv_formatter():
+    # Everything but the year and the date itself is the same for a given day of the year, so it is rendered once.
+    fragments = [','.join(_csv_field(value) for value in entry.values()) for entry in _ENTRY_TABLE]
+
+    def render(text, date):
+        return '{},{},{}\n'.format(_csv_field(text), fragments[date.day_of_year - 1], date.year)
+
+    return 'date,{}\n'.format(','.join(_FIELDS)), render
+
+
+def _jsonl_formatter():
+    # The JSON of each day's entry up to its year, without the opening brace so the date can go first.
+    fragments = [fragment[1:] for fragment in _JSON_FRAGMENTS]
+
+    def render(text, date):
+        return '{{"date": {}, {}{}}}\n'.format(json.dumps(text), fragments[date.day_of_year - 1], date.year)
+
+    return None, render
+
+
+_FORMATTERS = {
+    'csv': _csv_formatter,
+    'jsonl': _jsonl_formatter,
+}
+
+
+def _lines(f):
+    for line in f:
+        line = line.strip()
+        if line:
+            yield line
+
+
+def _column(f, column):
+    reader = csv.reader(f)
+    if column.isdigit():
+        idx = int(column)
+    else:
+        header = next(reader, [])
+        if column not in header:
+            raise SystemExit('column {!r} not found in header'.format(column))
+        idx = header.index(column)
+
+    for row in reader:
+        if len(row) > idx and row[idx].strip():
+            yield row[idx].strip()
+
+
+def convert_stream(values, out, fmt='csv', skip_invalid=False, errors=sys.stderr):
+    """
+    Converts an iterable of ISO date strings, writing one line per date to `out` in large chunks.
+
+    :param values: Iterable of String, ISO 8601 dates or datetimes. Only the date part is used.
+    :param out: A text file object to write to.
+    :param fmt: String, 'csv' or 'jsonl'.
+    :param skip_invalid: Boolean, report invalid dates to `errors` and carry on instead of raising ValueError.
+    :param errors: A text file object for reporting invalid dates.
+    :return: :int:, the number of dates converted.
+    """
+    header, render = _FORMATTERS[fmt]()
+
+    # Log style input repeats the same dates over and over, so remember recently rendered lines.
+    @functools.lru_cache(maxsize=65536)
+    def convert(text):
+        date = _ordinal_to_date(_normalize_date(text))
+        return render(text, date)
+
+    if header:
+        out.write(header)
+
+    count = 0
+    values = iter(values)
+    while True:
+        chunk = []
+        for text in itertools.islice(values, _CHUNK_LINES):
+            try:
+                chunk.append(convert(text))
+            except ValueError:
+                if not skip_invalid:
+                    raise ValueError('invalid date {!r}'.format(text))
+                errors.write('skipping invalid date {!r}\n'.format(text))
+        if not chunk:
+            break
+        out.write(''.join(chunk))
+        count += len(chunk)
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='aturan-calendar', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('files', nargs='*', default=['-'], help='files to read, - for stdin (default)')
+    parser.add_argument('-c', '--column',
+                        help='read CSV input and take the date from this column, by header name or by 0-based '
+                             'index for input without a header row')
+    parser.add_argument('-f', '--format', choices=sorted(_FORMATTERS), default='csv', help='output format')
+    parser.add_argument('-o', '--output', default='-', help='file to write, - for stdout (default)')
+    parser.add_argument('--skip-invalid', action='store_true', help='report invalid dates on stderr and carry on')
+    args = parser.parse_args(argv)
+
+    def values():
+        for path in args.files:
+            f = sys.stdin if path == '-' else open(path, newline='', buffering=_BUFFER_SIZE)
+            try:
+                yield from (_lines(f) if args.column is None else _column(f, args.column))
+            finally:
+                if f is not sys.stdin:
+                    f.close()
+
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', newline='', buffering=_BUFFER_SIZE)
+    try:
+        convert_stream(values(), out, args.format, args.skip_invalid)
+    except ValueError as e:
+        parser.exit(1, '{}: error: {}\n'.format(parser.prog, e))
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
@@ -1,5 +1,18 @@
+import array
+import collections
+import collections.abc
 import datetime
-import arrow
+import sys
+
+__all__ = [
+    'ATURAN_DAY_NAMES', 'ATURAN_MONTH_OF_YEAR_NAMES', 'ATURAN_DAYS_IN_YEAR', 'ATURAN_DAYS_IN_MONTH',
+    'ATURAN_DAYS_IN_SPAN', 'ATURAN_FIRST_HOLY_DAY', 'ATURAN_WINTERS_SOLSTICE_DAY',
+    'month_of_year', 'day_of_span', 'day_of_month', 'span_of_month', 'day_of_span_name', 'month_of_year_name',
+    'span_of_month_num', 'day_of_month_num',
+    'AturanDate', 'full_calendar', 'aturan_calendar_for_western_year', 'WesternYearCalendar', 'western_year_calendar',
+    'aturan_year_bounds', 'aturan_years_for_western_year', 'iter_aturan_range', 'western_to_aturan',
+    'western_to_aturan_date', 'aturan_to_western', 'aturan_parts_to_western', 'iter_aturan_days', 'Calendar',
+]
 
 # Book published 27-Mar-2007, 85th day
 # Felling Night, Reaping, 228th day
@@ -37,36 +50,132 @@ ATURAN_DAYS_IN_SPAN = 11
 ATURAN_FIRST_HOLY_DAY = 353
 ATURAN_WINTERS_SOLSTICE_DAY = 359
 
-_ORIGIN = arrow.get(2006, 8, 11)
+_MONTHS_IN_YEAR = 8
+_SPANS_IN_MONTH = ATURAN_DAYS_IN_MONTH // ATURAN_DAYS_IN_SPAN
 
+_ORIGIN_DATE = datetime.date(2006, 8, 11)
+_ORIGIN_ORDINAL = _ORIGIN_DATE.toordinal()
+_ORIGIN_YEAR = _ORIGIN_DATE.year
+_UNIX_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
 
-def _get_aturan_year(_ORIGIN, days):
-    return (_ORIGIN.year + 1) + ((days - 1) // ATURAN_DAYS_IN_YEAR)
+# How many of each supported Unix epoch unit make up a day.
+_EPOCH_UNITS = {
+    'seconds': 24 * 60 * 60,
+    'days': 1,
+}
+
+_MONTH_OF_YEAR_NUMBERS = {name: num for num, name in ATURAN_MONTH_OF_YEAR_NAMES.items()}
+_DAY_NUMBERS = {name: num for num, name in ATURAN_DAY_NAMES.items()}
+
+
+def __getattr__(name):
+    # arrow is only imported for callers that actually ask for the Arrow version of the origin.
+    if name == '_ORIGIN':
+        import arrow
+        globals()['_ORIGIN'] = origin = arrow.get(_ORIGIN_DATE)
+        return origin
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+def _get_aturan_year(days):
+    return (_ORIGIN_YEAR + 1) + ((days - 1) // ATURAN_DAYS_IN_YEAR)
 
 
-def _normalize_date(dateish):
+def _normalize_date(dateish, epoch_unit='seconds'):
+    # Everything is reduced to a proleptic Gregorian ordinal so the conversion itself is plain integer math.
     if isinstance(dateish, datetime.date):
-        return arrow.Arrow.fromdate(dateish)
+        return dateish.toordinal()
 
-    if isinstance(dateish, arrow.Arrow):
-        return dateish.floor('day')
+    if isinstance(dateish, str):
+        # Only the date part is used, but a time after it is still parsed so that malformed text is rejected. Both
+        # fromisoformat functions are implemented in C and are several times faster than validating fields in Python.
+        if len(dateish) > 10:
+            return datetime.datetime.fromisoformat(dateish).toordinal()
+        return datetime.date.fromisoformat(dateish).toordinal()
+
+    if isinstance(dateish, (int, float)) and not isinstance(dateish, bool):
+        if epoch_unit not in _EPOCH_UNITS:
+            raise ValueError('epoch_unit must be one of {}, not {!r}'.format(sorted(_EPOCH_UNITS), epoch_unit))
+        return _UNIX_EPOCH_ORDINAL + int(dateish // _EPOCH_UNITS[epoch_unit])
+
+    # An Arrow can only exist once arrow has been imported, so there is no need to import it here.
+    arrow = sys.modules.get('arrow')
+    if arrow is not None and isinstance(dateish, arrow.Arrow):
+        return dateish.date().toordinal()
 
     raise TypeError
 
 
+def _local_ordinal(dateish, tz, epoch_unit):
+    # Time zone support pulls in zoneinfo, so it is only imported once someone asks for a time zone. After that this
+    # placeholder is swapped for the real function to keep the relative import off the hot path.
+    global _local_ordinal
+    from .timezones import local_ordinal
+    _local_ordinal = local_ordinal
+    return local_ordinal(dateish, tz, epoch_unit)
+
+
 def _normalize_doy(days):
     return days - (((days - 1) // ATURAN_DAYS_IN_YEAR) * ATURAN_DAYS_IN_YEAR)
 
 
+_DayInfo = collections.namedtuple('_DayInfo', [
+    'day_of_year',
+    'month_of_year',
+    'span_of_month',
+    'day_of_span',
+    'day_of_month',
+    'month_of_year_name',
+    'span_of_month_num',
+    'day_of_span_name',
+    'day_of_month_num',
+])
+
+
+def _build_day_table():
+    table = []
+    for ndoy in range(1, ATURAN_DAYS_IN_YEAR + 1):
+        # Spans evenly divide months, so one divmod chain splits the day of the year into all of its fields.
+        month, dom = divmod(ndoy - 1, ATURAN_DAYS_IN_MONTH)
+        span, dos = divmod(dom, ATURAN_DAYS_IN_SPAN)
+        month, span, dos, dom = month + 1, span + 1, dos + 1, dom + 1
+
+        if ndoy >= ATURAN_FIRST_HOLY_DAY:
+            name = "High Mourning Day #{}".format(ndoy - (ATURAN_FIRST_HOLY_DAY - 1))
+            if ndoy == ATURAN_WINTERS_SOLSTICE_DAY:
+                name += ' (Winter\'s Solstice)'
+            table.append(_DayInfo(ndoy, month, span, dos, dom, None, None, name, None))
+        else:
+            table.append(_DayInfo(ndoy, month, span, dos, dom, ATURAN_MONTH_OF_YEAR_NAMES[month], span,
+                                  ATURAN_DAY_NAMES[dos], dom))
+    return tuple(table)
+
+
+# Every Aturan year has the same layout, so each field of each day of the year is computed once here. Index with
+# `(doy - 1) % ATURAN_DAYS_IN_YEAR`, which is `_normalize_doy(doy) - 1` without the extra call.
+_DAY_TABLE = _build_day_table()
+
+
+def _build_entry_table():
+    return tuple(
+        {
+            'day_of_year': info.day_of_year,
+            'month_of_year': info.month_of_year_name,
+            'span_of_month': info.span_of_month_num,
+            'day_of_span': info.day_of_span_name,
+            'day_of_month': info.day_of_month_num,
+        }
+        for info in _DAY_TABLE
+    )
+
+
+# The dict form of each day of the year, built once. Callers get a copy, which is cheaper than building a new dict
+# field by field.
+_ENTRY_TABLE = _build_entry_table()
+
+
 def _create_entry(ndoy):
-    ndoy = _normalize_doy(ndoy)
-    return {
-        'day_of_year': ndoy,
-        'month_of_year': month_of_year_name(ndoy),
-        'span_of_month': span_of_month_num(ndoy),
-        'day_of_span': day_of_span_name(ndoy),
-        'day_of_month': day_of_month_num(ndoy),
-    }
+    return _ENTRY_TABLE[(ndoy - 1) % ATURAN_DAYS_IN_YEAR].copy()
 
 
 def month_of_year(doy):
@@ -78,7 +187,7 @@ def month_of_year(doy):
         i.e. 362 becomes 3.
     :return: :int: the numerical value of the month (1-9)
     """
-    return ((_normalize_doy(doy) - 1) // ATURAN_DAYS_IN_MONTH) + 1
+    return _DAY_TABLE[(doy - 1) % ATURAN_DAYS_IN_YEAR].month_of_year
 
 
 def day_of_span(doy):
@@ -90,8 +199,7 @@ def day_of_span(doy):
         i.e. 362 becomes 3
     :return: :int: The numerical value of the day of the week/span (1-11)
     """
-    dos = _normalize_doy(doy) % ATURAN_DAYS_IN_SPAN
-    return ATURAN_DAYS_IN_SPAN if dos == 0 else dos
+    return _DAY_TABLE[(doy - 1) % ATURAN_DAYS_IN_YEAR].day_of_span
 
 
 def day_of_month(doy):
@@ -103,8 +211,7 @@ def day_of_month(doy):
         i.e. 362 becomes 3
     :return: :int: The numerical value of the day of the month (1-44)
     """
-    ndoy = _normalize_doy(doy)
-    return ndoy - (((ndoy - 1) // ATURAN_DAYS_IN_MONTH) * ATURAN_DAYS_IN_MONTH)
+    return _DAY_TABLE[(doy - 1) % ATURAN_DAYS_IN_YEAR].day_of_month
 
 
 def span_of_month(doy):
@@ -116,8 +223,7 @@ def span_of_month(doy):
         i.e. 362 becomes 3
     :return: :int: The numerical value of the span of the month (1-4)
     """
-    dom = day_of_month(doy)
-    return ((dom - 1) // ATURAN_DAYS_IN_SPAN) + 1
+    return _DAY_TABLE[(doy - 1) % ATURAN_DAYS_IN_YEAR].span_of_month
 
 
 def day_of_span_name(doy):
@@ -128,14 +234,7 @@ def day_of_span_name(doy):
         i.e. 362 becomes 3
     :return: :string: The name of the day of the week/span (i.e. 'Luten', 'Shuden', 'Theden', etc)
     """
-    ndoy = _normalize_doy(doy)
-    n = day_of_span(doy)
-    if ndoy >= ATURAN_FIRST_HOLY_DAY:
-        day = "High Mourning Day #{}".format(ndoy - (ATURAN_FIRST_HOLY_DAY - 1))
-        if ndoy == ATURAN_WINTERS_SOLSTICE_DAY:
-            day += ' (Winter\'s Solstice)'
-        return day
-    return ATURAN_DAY_NAMES[n]
+    return _DAY_TABLE[(doy - 1) % ATURAN_DAYS_IN_YEAR].day_of_span_name
 
 
 def month_of_year_name(doy):
@@ -146,11 +245,7 @@ def month_of_year_name(doy):
     :return: :string: or None, The name of the month of the year (i.e. 'Thaw', 'Equis', , 'Caitelyn', etc).
         The High Mourning Holy Days are not part of a month and thus will be None.
     """
-    ndoy = _normalize_doy(doy)
-    n = month_of_year(doy)
-    if ndoy >= ATURAN_FIRST_HOLY_DAY:
-        return None
-    return ATURAN_MONTH_OF_YEAR_NAMES[n]
+    return _DAY_TABLE[(doy - 1) % ATURAN_DAYS_IN_YEAR].month_of_year_name
 
 
 def span_of_month_num(doy):
@@ -162,11 +257,7 @@ def span_of_month_num(doy):
     :return: :int: or None, The numerical value of the span of the month (1-4). The High Mourning Holy Days are not
         part of a month and thus will be None.
     """
-    ndoy = _normalize_doy(doy)
-    n = span_of_month(ndoy)
-    if ndoy >= ATURAN_FIRST_HOLY_DAY:
-        return None
-    return n
+    return _DAY_TABLE[(doy - 1) % ATURAN_DAYS_IN_YEAR].span_of_month_num
 
 
 def day_of_month_num(doy):
@@ -178,54 +269,655 @@ def day_of_month_num(doy):
     :return: :int: or None, The numerical value of the day of the month (1-44). The High Mourning Holy Days are not
         part of a month and thus will be None.
     """
-    ndoy = _normalize_doy(doy)
-    n = day_of_month(ndoy)
+    return _DAY_TABLE[(doy - 1) % ATURAN_DAYS_IN_YEAR].day_of_month_num
+
+
+class AturanDate(collections.abc.Mapping):
+    """
+    An immutable, hashable Aturan date. Only the year and the day of the year are stored, every other field is looked
+        up from them. It reads like the :dict: returned by `western_to_aturan`, so `date['month_of_year']`,
+        `dict(date)`, and comparing against such a dict all work.
+
+    :param year: Integer, the Aturan year.
+    :param day_of_year: Integer, the Aturan day of the year (1-359).
+    """
+    __slots__ = ('_year', '_day_of_year')
+
+    _KEYS = ('day_of_year', 'month_of_year', 'span_of_month', 'day_of_span', 'day_of_month', 'year')
+
+    def __init__(self, year, day_of_year):
+        if not 1 <= day_of_year <= ATURAN_DAYS_IN_YEAR:
+            raise ValueError('day_of_year must be between 1 and {}, not {}'.format(ATURAN_DAYS_IN_YEAR, day_of_year))
+        object.__setattr__(self, '_year', year)
+        object.__setattr__(self, '_day_of_year', day_of_year)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('AturanDate is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('AturanDate is immutable')
+
+    def __reduce__(self):
+        return self.__class__, (self._year, self._day_of_year)
+
+    @property
+    def year(self):
+        return self._year
+
+    @property
+    def day_of_year(self):
+        return self._day_of_year
+
+    @property
+    def month_of_year(self):
+        return _DAY_TABLE[self._day_of_year - 1].month_of_year_name
+
+    @property
+    def span_of_month(self):
+        return _DAY_TABLE[self._day_of_year - 1].span_of_month_num
+
+    @property
+    def day_of_span(self):
+        return _DAY_TABLE[self._day_of_year - 1].day_of_span_name
+
+    @property
+    def day_of_month(self):
+        return _DAY_TABLE[self._day_of_year - 1].day_of_month_num
+
+    def __getitem__(self, key):
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self):
+        return len(self._KEYS)
+
+    def __eq__(self, other):
+        if isinstance(other, AturanDate):
+            return self._year == other._year and self._day_of_year == other._day_of_year
+        return super().__eq__(other)
+
+    def __hash__(self):
+        return hash((self._year, self._day_of_year))
+
+    def __lt__(self, other):
+        if not isinstance(other, AturanDate):
+            return NotImplemented
+        return (self._year, self._day_of_year) < (other._year, other._day_of_year)
+
+    def __le__(self, other):
+        if not isinstance(other, AturanDate):
+            return NotImplemented
+        return (self._year, self._day_of_year) <= (other._year, other._day_of_year)
+
+    def __gt__(self, other):
+        if not isinstance(other, AturanDate):
+            return NotImplemented
+        return (self._year, self._day_of_year) > (other._year, other._day_of_year)
+
+    def __ge__(self, other):
+        if not isinstance(other, AturanDate):
+            return NotImplemented
+        return (self._year, self._day_of_year) >= (other._year, other._day_of_year)
+
+    def __add__(self, days):
+        if not isinstance(days, int):
+            return NotImplemented
+        return self.add_days(days)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, AturanDate):
+            return ((self._year - other._year) * ATURAN_DAYS_IN_YEAR) + (self._day_of_year - other._day_of_year)
+        if not isinstance(other, int):
+            return NotImplemented
+        return self.add_days(-other)
+
+    def add_days(self, days):
+        """
+        :param days: Integer, the number of days to move, negative to go back. High Mourning Holy Days count as days.
+        :return: :AturanDate:
+        """
+        years, doy = divmod(self._day_of_year - 1 + days, ATURAN_DAYS_IN_YEAR)
+        return _aturan_date(self._year + years, doy + 1)
+
+    def add_spans(self, spans):
+        """
+        Moves by whole spans, keeping the day of the span. The High Mourning Holy Days are not part of any span, so
+            they are skipped over and can not be moved from.
+
+        :param spans: Integer, the number of spans to move, negative to go back.
+        :return: :AturanDate:
+        """
+        span_idx, day_idx = divmod(self._regular_day_idx('spans'), ATURAN_DAYS_IN_SPAN)
+        years, span_idx = divmod(span_idx + spans, _MONTHS_IN_YEAR * _SPANS_IN_MONTH)
+        return _aturan_date(self._year + years, span_idx * ATURAN_DAYS_IN_SPAN + day_idx + 1)
+
+    def add_months(self, months):
+        """
+        Moves by whole months, keeping the day of the month. The High Mourning Holy Days are not part of any month, so
+            they are skipped over and can not be moved from.
+
+        :param months: Integer, the number of months to move, negative to go back.
+        :return: :AturanDate:
+        """
+        month_idx, day_idx = divmod(self._regular_day_idx('months'), ATURAN_DAYS_IN_MONTH)
+        years, month_idx = divmod(month_idx + months, _MONTHS_IN_YEAR)
+        return _aturan_date(self._year + years, month_idx * ATURAN_DAYS_IN_MONTH + day_idx + 1)
+
+    def add_years(self, years):
+        """
+        :param years: Integer, the number of years to move, negative to go back. Every Aturan year has the same days.
+        :return: :AturanDate:
+        """
+        return _aturan_date(self._year + years, self._day_of_year)
+
+    def _regular_day_idx(self, unit):
+        if self._day_of_year >= ATURAN_FIRST_HOLY_DAY:
+            raise ValueError('Can not move a High Mourning Holy Day by {}'.format(unit))
+        return self._day_of_year - 1
+
+    def __repr__(self):
+        return 'AturanDate(year={}, day_of_year={})'.format(self._year, self._day_of_year)
+
+    def to_western(self):
+        """
+        :return: :datetime.date:, the Western/Gregorian date of this Aturan date.
+        """
+        return aturan_to_western(self._year, self._day_of_year)
+
+    def as_dict(self):
+        """
+        :return: :dict:, the same dictionary `western_to_aturan` returns for this date.
+        """
+        return dict(zip(self._KEYS, (self.day_of_year, self.month_of_year, self.span_of_month, self.day_of_span,
+                                     self.day_of_month, self.year)))
+
+
+_new_object = object.__new__
+_set_year = AturanDate._year.__set__
+_set_day_of_year = AturanDate._day_of_year.__set__
+
+
+def _aturan_date(year, day_of_year):
+    # For callers that have already worked out a valid day of the year. It skips the range check and the
+    # __setattr__ guard of the public constructor, which together cost more than the rest of a conversion.
+    date = _new_object(AturanDate)
+    _set_year(date, year)
+    _set_day_of_year(date, day_of_year)
+    return date
+
+
+class _ReadOnlyDict(dict):
+    """
+    A :dict: that refuses to be changed. Being a real dict, it still works with `json.dumps`, `pickle`, and
+        `copy.deepcopy`, unlike `types.MappingProxyType`.
+    """
+    __slots__ = ()
 
-    if ndoy >= ATURAN_FIRST_HOLY_DAY:
-        return None
-    return n
+    def _read_only(self, *args, **kwargs):
+        raise TypeError('{} is read-only, use full_calendar(copy=True) for one that can be changed'.format(
+            type(self).__name__))
 
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _read_only
 
-def full_calendar():
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+
+def full_calendar(copy=False):
     """
-    Creates a 359 day representation of the Aturan calendar. There is no Year because the Aturan Calendar is consistent.
+    Returns a 359 day representation of the Aturan calendar. There is no Year because the Aturan Calendar is consistent.
+        The calendar never changes, so by default every caller shares one read-only mapping built at import.
+
+    :param copy: Boolean, return a new :dict: of :dict: that can be changed instead of the shared read-only one.
     :return: :dict: of :dict:, the outer key is the day of the year. Inner keys are 'day_of_year', 'month_of_year',
-        'span_of_month', and 'day_of_span'.
+        'span_of_month', 'day_of_span', and 'day_of_month'. Without `copy`, both levels raise TypeError when changed.
     """
+    if not copy:
+        return _FULL_CALENDAR
     return {
-        i: _create_entry(i)
-        for i
-        in range(1, 360)
+        entry['day_of_year']: entry.copy()
+        for entry
+        in _ENTRY_TABLE
     }
 
 
+_FULL_CALENDAR = _ReadOnlyDict(
+    (entry['day_of_year'], _ReadOnlyDict(entry))
+    for entry
+    in _ENTRY_TABLE
+)
+
+
 def aturan_calendar_for_western_year(year):
     """
     Creates a 365 day dictionary of Aturan days for the given Western/Gregorian year.  Aturan years are only 359 days
-        long, so at some point the items will change year.
+        long, so at some point the items will change year. See `western_year_calendar` for a much more compact
+        version of the same information.
 
     :param year: Integer, the Western/Gregorian year for which you want the Aturan equivalent
     :return: :dict: of :dict:, Outer key is the Gregorian day of the year, inner keys are 'day_of_year',
         'month_of_year', 'span_of_month', 'day_of_span', and 'year'.
     """
-    year_begin = arrow.get(year, 1, 1)
-    year_end = year_begin.shift(years=+1, days=-1)
-    idx = 1
+    return _western_year_dicts(WesternYearCalendar(year))
+
+
+def _western_year_dicts(columns):
     rtn = {}
-    for day in arrow.Arrow.range('day', year_begin, year_end):
-        rtn[idx] = western_to_aturan(day)
-        idx += 1
+    for idx, (aturan_year, doy) in enumerate(zip(columns.years, columns.days_of_year), 1):
+        entry = _create_entry(doy)
+        entry['year'] = aturan_year
+        rtn[idx] = entry
     return rtn
 
 
-def western_to_aturan(dateish):
+class WesternYearCalendar(collections.abc.Mapping):
+    """
+    The Aturan dates for every day of a Western/Gregorian year, kept as two `array.array` columns: `years` and
+        `days_of_year`. Keys are the Gregorian day of the year (1-365 or 1-366) and values are `AturanDate`, built
+        on access.
+
+    :param year: Integer, the Western/Gregorian year for which you want the Aturan equivalent
+    :param calendar: Calendar, optional. The origin to convert with, instead of the module's own.
+    """
+    __slots__ = ('western_year', 'years', 'days_of_year')
+
+    def __init__(self, year, calendar=None):
+        calendar = _DEFAULT_CALENDAR if calendar is None else calendar
+        start = datetime.date(year, 1, 1).toordinal()
+        length = datetime.date(year + 1, 1, 1).toordinal() - start
+        years, idx = divmod(start - calendar.origin_ordinal - 1, ATURAN_DAYS_IN_YEAR)
+        aturan_year = calendar.first_year + years
+        first_doy = idx + 1
+
+        # A Gregorian year always fits in fewer than three Aturan years, so step through them a whole run at a time.
+        self.western_year = year
+        self.years = array.array('i')
+        self.days_of_year = array.array('H')
+        doy = first_doy
+        while len(self.days_of_year) < length:
+            run = min(ATURAN_DAYS_IN_YEAR - doy + 1, length - len(self.days_of_year))
+            self.years.extend(array.array('i', [aturan_year]) * run)
+            self.days_of_year.extend(range(doy, doy + run))
+            aturan_year += 1
+            doy = 1
+
+    def __getitem__(self, gregorian_doy):
+        if not 1 <= gregorian_doy <= len(self.days_of_year):
+            raise KeyError(gregorian_doy)
+        return _aturan_date(self.years[gregorian_doy - 1], self.days_of_year[gregorian_doy - 1])
+
+    def __iter__(self):
+        return iter(range(1, len(self.days_of_year) + 1))
+
+    def __len__(self):
+        return len(self.days_of_year)
+
+    def segments(self):
+        """
+        Splits the year where the Aturan year changes.
+
+        :return: :list: of :tuple:, one per Aturan year in order: the Aturan year, and the first and last Gregorian day
+            of the year that fall in it.
+        """
+        rtn = []
+        length = len(self.days_of_year)
+        aturan_year = self.years[0]
+        start = 1
+        end = min(ATURAN_DAYS_IN_YEAR - self.days_of_year[0] + 1, length)
+        while start <= length:
+            rtn.append((aturan_year, start, end))
+            aturan_year += 1
+            start, end = end + 1, min(end + ATURAN_DAYS_IN_YEAR, length)
+        return rtn
+
+    def __repr__(self):
+        return 'WesternYearCalendar({})'.format(self.western_year)
+
+
+def western_year_calendar(year):
+    """
+    Creates a compact, column based calendar of Aturan days for the given Western/Gregorian year.
+
+    :param year: Integer, the Western/Gregorian year for which you want the Aturan equivalent
+    :return: :WesternYearCalendar:, a read-only mapping of Gregorian day of the year to `AturanDate`.
+    """
+    return WesternYearCalendar(year)
+
+
+def aturan_year_bounds(year):
+    """
+    Returns the Western/Gregorian dates on which an Aturan year starts and ends. Every Aturan year is the same length,
+        so this is plain arithmetic and works for any year.
+
+    :param year: Integer, the Aturan year.
+    :return: :tuple: of :datetime.date:, the first and last day of the year.
+    """
+    return _DEFAULT_CALENDAR.aturan_year_bounds(year)
+
+
+def aturan_years_for_western_year(year):
+    """
+    Returns the Aturan years that overlap a Western/Gregorian year, which is always two or three of them.
+
+    :param year: Integer, the Western/Gregorian year.
+    :return: :range: of Aturan years.
+    """
+    return _DEFAULT_CALENDAR.aturan_years_for_western_year(year)
+
+
+def iter_aturan_range(start, end, step=1):
+    """
+    Lazily yields the Aturan dates for a range of Western/Gregorian dates. Only the first date is converted, every
+        other one is found by advancing the day and year counters, so arbitrarily long ranges use constant memory.
+
+    :param start: datetime.Date, datetime.DateTime, Arrow, ISO 8601 String, or Unix timestamp in seconds. The first
+        date of the range.
+    :param end: datetime.Date, datetime.DateTime, Arrow, ISO 8601 String, or Unix timestamp in seconds. The last date
+        of the range, included if it falls on a step.
+    :param step: Integer, the number of days between each yielded date.
+    :return: :generator: of :AturanDate:
+    """
+    return _DEFAULT_CALENDAR.iter_aturan_range(start, end, step)
+
+
+def _iter_dates(year, doy, count, step):
+    for _ in range(count):
+        yield _aturan_date(year, doy)
+        doy += step
+        if doy > ATURAN_DAYS_IN_YEAR:
+            years, doy = divmod(doy - 1, ATURAN_DAYS_IN_YEAR)
+            year += years
+            doy += 1
+
+
+def western_to_aturan(dateish, epoch_unit='seconds', tz=None):
     """
     Returns the Aturan date information for a given Western/Gregorian date.
 
-    :param dateish: datetime.Date, datetime.DateTime, or Arrow. The date for which you want the Aturan equivalent.
+    :param dateish: datetime.Date, datetime.DateTime, Arrow, ISO 8601 String, or Unix timestamp. The date for which
+        you want the Aturan equivalent. Without `tz`, the date part of a datetime, Arrow, or String is used as it is
+        and timestamps are taken in UTC.
+    :param epoch_unit: String, 'seconds' or 'days', the unit of a Unix timestamp.
+    :param tz: String or datetime.tzinfo, optional. A time zone such as 'America/New_York'. Timestamps, Arrows,
+        datetimes, and Strings with a time are converted to the day they fall on in this zone, with naive values taken
+        as UTC.
     :return: :dict:, keys are 'day_of_year', 'month_of_year', 'span_of_month', 'day_of_span', 'year'.
     """
-    days = (_normalize_date(dateish) - _ORIGIN).days
-    entry = _create_entry(days)
-    entry['year'] = _get_aturan_year(_ORIGIN, days)
+    if tz is None:
+        return _ordinal_to_aturan(_normalize_date(dateish, epoch_unit))
+    return _ordinal_to_aturan(_local_ordinal(dateish, tz, epoch_unit))
+
+
+# The origin is a default argument so the module functions pay nothing for it, and `Calendar` passes its own.
+def _ordinal_to_aturan(ordinal, origin_ordinal=_ORIGIN_ORDINAL, first_year=_ORIGIN_YEAR + 1):
+    # One divmod gives both the year and the day of the year.
+    years, idx = divmod(ordinal - origin_ordinal - 1, ATURAN_DAYS_IN_YEAR)
+    entry = _ENTRY_TABLE[idx].copy()
+    entry['year'] = first_year + years
     return entry
+
+
+def western_to_aturan_date(dateish, epoch_unit='seconds', tz=None):
+    """
+    Returns the Aturan date for a given Western/Gregorian date as a compact `AturanDate` instead of a :dict:.
+
+    :param dateish: datetime.Date, datetime.DateTime, Arrow, ISO 8601 String, or Unix timestamp. See
+        `western_to_aturan`.
+    :param epoch_unit: String, 'seconds' or 'days', the unit of a Unix timestamp.
+    :param tz: String or datetime.tzinfo, optional. See `western_to_aturan`.
+    :return: :AturanDate:
+    """
+    if tz is None:
+        return _ordinal_to_date(_normalize_date(dateish, epoch_unit))
+    return _ordinal_to_date(_local_ordinal(dateish, tz, epoch_unit))
+
+
+def _ordinal_to_date(ordinal, origin_ordinal=_ORIGIN_ORDINAL, first_year=_ORIGIN_YEAR + 1):
+    years, idx = divmod(ordinal - origin_ordinal - 1, ATURAN_DAYS_IN_YEAR)
+    return _aturan_date(first_year + years, idx + 1)
+
+
+def aturan_to_western(year, day_of_year):
+    """
+    Returns the Western/Gregorian date for a given Aturan date.
+
+    :param year: Integer, the Aturan year.
+    :param day_of_year: Integer, the Aturan day of the year (1-359).
+    :return: :datetime.date:
+    """
+    return _DEFAULT_CALENDAR.aturan_to_western(year, day_of_year)
+
+
+def _aturan_to_ordinal(year, day_of_year, origin_ordinal=_ORIGIN_ORDINAL, first_year=_ORIGIN_YEAR + 1):
+    return origin_ordinal + (year - first_year) * ATURAN_DAYS_IN_YEAR + day_of_year
+
+
+def _month_number(month):
+    month = _MONTH_OF_YEAR_NUMBERS.get(month, month)
+    if month not in ATURAN_MONTH_OF_YEAR_NAMES:
+        raise ValueError('Unknown month {!r}'.format(month))
+    return month
+
+
+def _day_number(day):
+    day = _DAY_NUMBERS.get(day, day)
+    if day not in ATURAN_DAY_NAMES:
+        raise ValueError('Unknown day {!r}'.format(day))
+    return day
+
+
+def _span_number(span):
+    if span not in range(1, _SPANS_IN_MONTH + 1):
+        raise ValueError('span must be between 1 and {}, not {!r}'.format(_SPANS_IN_MONTH, span))
+    return span
+
+
+def _parts_to_doy(month, span, day):
+    month = _month_number(month)
+    day = _day_number(day)
+    span = _span_number(span)
+
+    doy = (month - 1) * ATURAN_DAYS_IN_MONTH + (span - 1) * ATURAN_DAYS_IN_SPAN + day
+    if doy > ATURAN_DAYS_IN_YEAR:
+        raise ValueError('The High Mourning Holy Days only have one span of {} days'.format(
+            ATURAN_DAYS_IN_YEAR - ATURAN_FIRST_HOLY_DAY + 1))
+    return doy
+
+
+def aturan_parts_to_western(year, month, span, day):
+    """
+    Returns the Western/Gregorian date for a given Aturan year, month, span, and day of the span.
+
+    :param year: Integer, the Aturan year.
+    :param month: String or Integer, the month name (i.e. 'Thaw', 'Reaping', etc) or number (1-8). The High Mourning
+        Holy Days are month 9 (or '').
+    :param span: Integer, the span of the month (1-4). The High Mourning Holy Days only have span 1.
+    :param day: String or Integer, the day of the span name (i.e. 'Luten', 'Felling', etc) or number (1-11). The
+        High Mourning Holy Days only have days 1-7.
+    :return: :datetime.date:
+    """
+    return _DEFAULT_CALENDAR.aturan_parts_to_western(year, month, span, day)
+
+
+def _as_numbers(values, default, to_number):
+    if values is None:
+        return default
+    if isinstance(values, (str, int)):
+        values = [values]
+    return sorted({to_number(value) for value in values})
+
+
+def iter_aturan_days(years, months=None, spans=None, days=None):
+    """
+    Lazily yields every Aturan date matching a pattern, in order, working out each day of the year directly so only
+        the matching days are visited.
+
+    For example, every Felling in Reaping 2010 is `iter_aturan_days(2010, 'Reaping', days='Felling')`. The High
+        Mourning Holy Days are month 9 (or ''), with a single span of days 1-7.
+
+    :param years: Integer or iterable of Integer, the Aturan years to search.
+    :param months: String, Integer, or an iterable of them, optional. Month names or numbers (1-9).
+    :param spans: Integer or iterable of Integer, optional. Spans of the month (1-4).
+    :param days: String, Integer, or an iterable of them, optional. Day of the span names or numbers (1-11).
+    :return: :generator: of :AturanDate:
+    """
+    months = _as_numbers(months, sorted(ATURAN_MONTH_OF_YEAR_NAMES), _month_number)
+    spans = _as_numbers(spans, range(1, _SPANS_IN_MONTH + 1), _span_number)
+    days = _as_numbers(days, sorted(ATURAN_DAY_NAMES), _day_number)
+    doys = [
+        doy
+        for doy in (
+            (month - 1) * ATURAN_DAYS_IN_MONTH + (span - 1) * ATURAN_DAYS_IN_SPAN + day
+            for month in months
+            for span in spans
+            for day in days
+        )
+        if doy <= ATURAN_DAYS_IN_YEAR
+    ]
+
+    for year in ([years] if isinstance(years, int) else years):
+        for doy in doys:
+            yield _aturan_date(year, doy)
+
+
+class Calendar:
+    """
+    An Aturan calendar anchored to its own point of origin, for when the guesswork behind the default origin does not
+        suit. Its methods mirror the module functions of the same name. Every Aturan year has the same layout no matter
+        the origin, so calendars share the day of the year tables and only keep their origin ordinal and first year.
+        Calendars are immutable and can be shared between threads.
+
+    `AturanDate.to_western` always uses the default origin; use `Calendar.aturan_to_western` instead.
+
+    :param origin: datetime.Date, datetime.DateTime, Arrow, or ISO 8601 String, optional. The point of origin: the
+        day after it starts the Aturan year after its Western/Gregorian year. Defaults to 11-Aug-2006, which makes
+        27-Mar-2007 Felling Night in Reaping 2007.
+    """
+    __slots__ = ('origin_ordinal', 'first_year')
+
+    def __init__(self, origin=None):
+        origin = _ORIGIN_ORDINAL if origin is None else _normalize_date(origin)
+        object.__setattr__(self, 'origin_ordinal', origin)
+        object.__setattr__(self, 'first_year', datetime.date.fromordinal(origin).year + 1)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Calendar is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('Calendar is immutable')
+
+    def __reduce__(self):
+        return Calendar, (self.origin,)
+
+    @property
+    def origin(self):
+        return datetime.date.fromordinal(self.origin_ordinal)
+
+    def __eq__(self, other):
+        if isinstance(other, Calendar):
+            return self.origin_ordinal == other.origin_ordinal
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.origin_ordinal)
+
+    def __repr__(self):
+        return 'Calendar(origin={!r})'.format(self.origin)
+
+    def western_to_aturan(self, dateish, epoch_unit='seconds', tz=None):
+        """
+        See `western_to_aturan`.
+
+        :return: :dict:, keys are 'day_of_year', 'month_of_year', 'span_of_month', 'day_of_span', 'year'.
+        """
+        if tz is None:
+            return _ordinal_to_aturan(_normalize_date(dateish, epoch_unit), self.origin_ordinal, self.first_year)
+        return _ordinal_to_aturan(_local_ordinal(dateish, tz, epoch_unit), self.origin_ordinal, self.first_year)
+
+    def western_to_aturan_date(self, dateish, epoch_unit='seconds', tz=None):
+        """
+        See `western_to_aturan_date`.
+
+        :return: :AturanDate:
+        """
+        if tz is None:
+            return _ordinal_to_date(_normalize_date(dateish, epoch_unit), self.origin_ordinal, self.first_year)
+        return _ordinal_to_date(_local_ordinal(dateish, tz, epoch_unit), self.origin_ordinal, self.first_year)
+
+    def aturan_to_western(self, year, day_of_year):
+        """
+        See `aturan_to_western`.
+
+        :return: :datetime.date:
+        """
+        if not 1 <= day_of_year <= ATURAN_DAYS_IN_YEAR:
+            raise ValueError('day_of_year must be between 1 and {}, not {}'.format(ATURAN_DAYS_IN_YEAR, day_of_year))
+        return datetime.date.fromordinal(_aturan_to_ordinal(year, day_of_year, self.origin_ordinal, self.first_year))
+
+    def aturan_parts_to_western(self, year, month, span, day):
+        """
+        See `aturan_parts_to_western`.
+
+        :return: :datetime.date:
+        """
+        doy = _parts_to_doy(month, span, day)
+        return datetime.date.fromordinal(_aturan_to_ordinal(year, doy, self.origin_ordinal, self.first_year))
+
+    def aturan_calendar_for_western_year(self, year):
+        """
+        See `aturan_calendar_for_western_year`.
+
+        :return: :dict: of :dict:
+        """
+        return _western_year_dicts(WesternYearCalendar(year, self))
+
+    def western_year_calendar(self, year):
+        """
+        See `western_year_calendar`.
+
+        :return: :WesternYearCalendar:
+        """
+        return WesternYearCalendar(year, self)
+
+    def iter_aturan_range(self, start, end, step=1):
+        """
+        See `iter_aturan_range`.
+
+        :return: :generator: of :AturanDate:
+        """
+        if step < 1:
+            raise ValueError('step must be a positive number of days, not {}'.format(step))
+
+        ordinal = _normalize_date(start)
+        count = (_normalize_date(end) - ordinal) // step + 1
+        years, idx = divmod(ordinal - self.origin_ordinal - 1, ATURAN_DAYS_IN_YEAR)
+        return _iter_dates(self.first_year + years, idx + 1, count, step)
+
+    def aturan_year_bounds(self, year):
+        """
+        See `aturan_year_bounds`.
+
+        :return: :tuple: of :datetime.date:
+        """
+        first = _aturan_to_ordinal(year, 1, self.origin_ordinal, self.first_year)
+        return datetime.date.fromordinal(first), datetime.date.fromordinal(first + ATURAN_DAYS_IN_YEAR - 1)
+
+    def aturan_years_for_western_year(self, year):
+        """
+        See `aturan_years_for_western_year`.
+
+        :return: :range: of Aturan years.
+        """
+        first = datetime.date(year, 1, 1).toordinal() - self.origin_ordinal - 1
+        last = datetime.date(year, 12, 31).toordinal() - self.origin_ordinal - 1
+        return range(self.first_year + first // ATURAN_DAYS_IN_YEAR, self.first_year + last // ATURAN_DAYS_IN_YEAR + 1)
+
+
+# The module functions that do not sit on the conversion hot path are this calendar's methods.
+_DEFAULT_CALENDAR = Calendar()
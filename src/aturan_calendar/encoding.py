@@ -0,0 +1,120 @@
+"""
+Compact encodings of Aturan dates for sending them over the wire, each with a matching decoder.
+
+* A packed integer, `(year << 9) | day_of_year`. Days of the year fit in 9 bits, so the integers sort in date order.
+* Bytes of packed integers, 4 little-endian bytes per date.
+* JSON, identical to `json.dumps` of the dict from `western_to_aturan` but put together from fragments encoded once
+  for each of the 359 days of the year, so only the year is encoded per date.
+
+Encoders take an `AturanDate` or any mapping with 'year' and 'day_of_year', such as the dicts from `western_to_aturan`.
+Decoders return `AturanDate`.
+"""
+import json
+import struct
+
+from . import core
+from .core import ATURAN_DAYS_IN_YEAR, AturanDate, _ENTRY_TABLE, _ORIGIN_ORDINAL, _ORIGIN_YEAR, _normalize_date
+
+_DOY_BITS = 9
+_DOY_MASK = (1 << _DOY_BITS) - 1
+_PACKED = struct.Struct('<i')
+
+# Everything but the closing brace of each day's entry, in the same key order `western_to_aturan` uses.
+_JSON_FRAGMENTS = tuple(json.dumps(entry)[:-1] + ', "year": ' for entry in _ENTRY_TABLE)
+
+
+def _parts(date):
+    if isinstance(date, AturanDate):
+        return date.year, date.day_of_year
+    # A mapping can hold anything, and a day of the year out of range would spill into the year bits or the JSON.
+    year, doy = date['year'], date['day_of_year']
+    if not 1 <= doy <= ATURAN_DAYS_IN_YEAR:
+        raise ValueError('day_of_year must be between 1 and {}, not {}'.format(ATURAN_DAYS_IN_YEAR, doy))
+    return year, doy
+
+
+def to_int(date):
+    """
+    :param date: AturanDate, or a mapping with 'year' and 'day_of_year'.
+    :return: :int:, the year and day of the year packed as `(year << 9) | day_of_year`.
+    """
+    year, doy = _parts(date)
+    return (year << _DOY_BITS) | doy
+
+
+def from_int(value):
+    """
+    :param value: Integer, from `to_int`.
+    :return: :AturanDate:
+    """
+    return AturanDate(value >> _DOY_BITS, value & _DOY_MASK)
+
+
+def to_bytes(dates):
+    """
+    :param dates: Iterable of AturanDate, or of mappings with 'year' and 'day_of_year'.
+    :return: :bytes:, each date packed by `to_int` into a little-endian signed 32 bit integer.
+    """
+    values = [to_int(date) for date in dates]
+    return struct.pack('<{}i'.format(len(values)), *values)
+
+
+def from_bytes(data):
+    """
+    :param data: Bytes, from `to_bytes`.
+    :return: :list: of :AturanDate:
+    """
+    if len(data) % _PACKED.size:
+        raise ValueError('data must be a multiple of {} bytes long, not {}'.format(_PACKED.size, len(data)))
+    return [AturanDate(value >> _DOY_BITS, value & _DOY_MASK)
+            for value in struct.unpack('<{}i'.format(len(data) // _PACKED.size), data)]
+
+
+def to_json(date):
+    """
+    :param date: AturanDate, or a mapping with 'year' and 'day_of_year'.
+    :return: :str:, the same JSON object `json.dumps` gives for the dict from `western_to_aturan`.
+    """
+    year, doy = _parts(date)
+    return '{}{}}}'.format(_JSON_FRAGMENTS[doy - 1], year)
+
+
+def to_json_array(dates):
+    """
+    :param dates: Iterable of AturanDate, or of mappings with 'year' and 'day_of_year'.
+    :return: :str:, a JSON array of `to_json` objects.
+    """
+    return '[{}]'.format(', '.join(to_json(date) for date in dates))
+
+
+def western_to_json(dateish, epoch_unit='seconds', tz=None):
+    """
+    Converts a Western/Gregorian date straight to the JSON for its Aturan date, without building a dict or an
+        `AturanDate` in between. Gives the same text as `json.dumps(western_to_aturan(...))`.
+
+    :param dateish: datetime.Date, datetime.DateTime, Arrow, ISO 8601 String, or Unix timestamp. See
+        `western_to_aturan`.
+    :param epoch_unit: String, 'seconds' or 'days', the unit of a Unix timestamp.
+    :param tz: String or datetime.tzinfo, optional. See `western_to_aturan`.
+    :return: :str:
+    """
+    # core._local_ordinal replaces itself once time zone support is loaded, so it is looked up on the module each time.
+    ordinal = _normalize_date(dateish, epoch_unit) if tz is None else core._local_ordinal(dateish, tz, epoch_unit)
+    years, idx = divmod(ordinal - _ORIGIN_ORDINAL - 1, ATURAN_DAYS_IN_YEAR)
+    return '{}{}}}'.format(_JSON_FRAGMENTS[idx], _ORIGIN_YEAR + 1 + years)
+
+
+def _from_object(obj):
+    return AturanDate(obj['year'], obj['day_of_year'])
+
+
+def from_json(text):
+    """
+    :param text: String, a JSON object from `to_json` or array from `to_json_array`. Only 'year' and 'day_of_year'
+        are read.
+    :return: :AturanDate:, or :list: of :AturanDate: for an array.
+    """
+    value = json.loads(text)
+    if isinstance(value, list):
+        return [_from_object(obj) for obj in value]
+    return _from_object(value)
@@ -0,0 +1,148 @@
+"""
+Opt-in counters and timings for the stages of a conversion, to see where the time goes under real traffic.
+
+    >>> from aturan_calendar import instrumentation
+    >>> instrumentation.enable()
+    >>> ...
+    >>> instrumentation.stats()
+    {'normalize_date[date]': {'calls': 1200, 'seconds': 0.0004}, 'ordinal_to_aturan': {...}, ...}
+
+`enable` swaps timed wrappers in for the stage functions of `aturan_calendar.core` and `disable` puts the originals
+back, so nothing is measured and nothing is paid while instrumentation is off. Conversions made by the module functions
+and `Calendar` methods are counted; the NumPy, table file, cache, and command line helpers hold their own references
+to the stage functions and are not.
+
+Timings are cumulative and include any stage called from inside another.
+"""
+import collections
+import threading
+import time
+
+from . import core
+
+# Stage name, the core function it times, and whether calls are broken down by the type of their first argument.
+_STAGES = (
+    ('normalize_date', '_normalize_date', True),
+    ('local_ordinal', '_local_ordinal', True),
+    ('create_entry', '_create_entry', False),
+    ('ordinal_to_aturan', '_ordinal_to_aturan', False),
+    ('ordinal_to_date', '_ordinal_to_date', False),
+)
+
+_lock = threading.Lock()
+_originals = {}
+# (stage, input type or None) -> [calls, seconds]
+_counters = collections.defaultdict(lambda: [0, 0.0])
+
+
+def _timed(stage, func, by_type):
+    perf_counter = time.perf_counter
+
+    def record(key, elapsed):
+        with _lock:
+            counter = _counters[key]
+            counter[0] += 1
+            counter[1] += elapsed
+
+    if by_type:
+        def wrapper(value, *args):
+            start = perf_counter()
+            try:
+                return func(value, *args)
+            finally:
+                record((stage, type(value).__name__), perf_counter() - start)
+    else:
+        def wrapper(*args):
+            start = perf_counter()
+            try:
+                return func(*args)
+            finally:
+                record((stage, None), perf_counter() - start)
+
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+_timezones = {}
+
+
+def _load_local_ordinal(dateish, tz, epoch_unit):
+    # `core._local_ordinal` loads time zone support on first use by replacing itself, which would replace the wrapper
+    # too. This loads it the same way without touching `core`, so zoneinfo is still only imported once it is needed.
+    local_ordinal = _timezones.get('local_ordinal')
+    if local_ordinal is None:
+        from .timezones import local_ordinal
+        _timezones['local_ordinal'] = local_ordinal
+    return local_ordinal(dateish, tz, epoch_unit)
+
+
+def enable():
+    """
+    Starts counting and timing conversions. Counts are kept from any earlier run; see `reset`.
+    """
+    with _lock:
+        if _originals:
+            return
+        for stage, name, by_type in _STAGES:
+            func = _originals[name] = getattr(core, name)
+            if name == '_local_ordinal' and func.__module__ == core.__name__:
+                func = _load_local_ordinal
+            setattr(core, name, _timed(stage, func, by_type))
+
+
+def disable():
+    """
+    Stops counting and puts the original, untimed functions back. The counts so far are kept.
+    """
+    with _lock:
+        for name, func in _originals.items():
+            setattr(core, name, func)
+        _originals.clear()
+
+
+def is_enabled():
+    return bool(_originals)
+
+
+def reset():
+    """
+    Clears every count and timing.
+    """
+    with _lock:
+        _counters.clear()
+
+
+def _snapshot():
+    with _lock:
+        return sorted((key, tuple(counter)) for key, counter in _counters.items())
+
+
+def stats():
+    """
+    :return: :dict: keyed by stage, with the input type in brackets for stages that are broken down by it. Values are
+        dicts with 'calls' and cumulative 'seconds'.
+    """
+    return {
+        stage if input_type is None else '{}[{}]'.format(stage, input_type): {'calls': calls, 'seconds': seconds}
+        for (stage, input_type), (calls, seconds) in _snapshot()
+    }
+
+
+def prometheus_text(prefix='aturan_calendar'):
+    """
+    :param prefix: String, prepended to the metric names.
+    :return: :str:, the counts and timings in the Prometheus text exposition format, with `stage` and `input` labels.
+    """
+    snapshot = _snapshot()
+    lines = []
+    for metric, help_text, idx in (('calls_total', 'Conversion stage calls.', 0),
+                                   ('seconds_total', 'Cumulative seconds spent in each conversion stage.', 1)):
+        name = '{}_stage_{}'.format(prefix, metric)
+        lines.append('# HELP {} {}'.format(name, help_text))
+        lines.append('# TYPE {} counter'.format(name))
+        for (stage, input_type), values in snapshot:
+            labels = 'stage="{}"'.format(stage)
+            if input_type is not None:
+                labels += ',input="{}"'.format(input_type)
+            lines.append('{}{{{}}} {!r}'.format(name, labels, values[idx]))
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,100 @@
+"""
+A `.aturan` accessor for pandas datetime Series. Requires the optional `pandas` dependency and registers itself on
+import:
+
+    >>> import aturan_calendar.pandas_accessor  # noqa
+    >>> df['date'].aturan.month_of_year
+"""
+import numpy as np
+import pandas as pd
+
+from .arrays import western_to_aturan_array
+from .core import ATURAN_DAY_NAMES, ATURAN_DAYS_IN_YEAR, ATURAN_FIRST_HOLY_DAY, ATURAN_MONTH_OF_YEAR_NAMES, _DAY_TABLE
+
+MONTH_CATEGORIES = pd.CategoricalDtype([ATURAN_MONTH_OF_YEAR_NAMES[n] for n in range(1, 9)], ordered=True)
+DAY_OF_SPAN_CATEGORIES = pd.CategoricalDtype(
+    [ATURAN_DAY_NAMES[n] for n in range(1, 12)] +
+    [_DAY_TABLE[doy - 1].day_of_span_name for doy in range(ATURAN_FIRST_HOLY_DAY, ATURAN_DAYS_IN_YEAR + 1)],
+    ordered=True,
+)
+
+_FIELDS = ('day_of_year', 'month_of_year', 'span_of_month', 'day_of_span', 'day_of_month', 'year')
+
+
+@pd.api.extensions.register_series_accessor('aturan')
+class AturanAccessor:
+    """
+    Aturan fields for every value of a datetime Series, computed in one vectorized pass and returned as Series with the
+        same index. Time zone aware values use their local date. Missing values (NaT) stay missing, as do the fields
+        that are None for the High Mourning Holy Days.
+    """
+
+    def __init__(self, series):
+        if not pd.api.types.is_datetime64_any_dtype(series.dtype):
+            raise AttributeError('Can only use .aturan accessor with datetime values')
+        self._series = series
+        self._columns = None
+
+    def _compute(self):
+        values = self._series
+        if getattr(values.dtype, 'tz', None) is not None:
+            values = values.dt.tz_localize(None)
+        missing = values.isna().to_numpy()
+        # Keep the Series' own unit: forcing nanoseconds would overflow for dates outside roughly 1677-2262. Missing
+        # values are converted as the Unix epoch and masked below.
+        dates = values.to_numpy()
+        result = western_to_aturan_array(np.where(missing, np.zeros(1, dtype=dates.dtype), dates))
+        holy = (result['month_of_year'] == 0) & ~missing
+        no_month = holy | missing
+
+        month_codes = np.where(no_month, -1, result['month_of_year'] - 1)
+        day_codes = np.where(holy, result['day_of_span'] - 1 + len(ATURAN_DAY_NAMES), result['day_of_span'] - 1)
+        day_codes[missing] = -1
+
+        index = self._series.index
+        return {
+            'day_of_year': pd.Series(pd.array(result['day_of_year'], dtype='Int16'), index=index).mask(missing),
+            'month_of_year': pd.Series(pd.Categorical.from_codes(month_codes, dtype=MONTH_CATEGORIES), index=index),
+            'span_of_month': pd.Series(pd.array(result['span_of_month'], dtype='Int8'), index=index).mask(no_month),
+            'day_of_span': pd.Series(pd.Categorical.from_codes(day_codes, dtype=DAY_OF_SPAN_CATEGORIES), index=index),
+            'day_of_month': pd.Series(pd.array(result['day_of_month'], dtype='Int8'), index=index).mask(no_month),
+            'year': pd.Series(pd.array(result['year'], dtype='Int64'), index=index).mask(missing),
+        }
+
+    def _column(self, name):
+        # pandas caches the accessor on its Series, so every field is computed in the same single pass.
+        if self._columns is None:
+            self._columns = self._compute()
+        return self._columns[name].rename(name)
+
+    @property
+    def year(self):
+        return self._column('year')
+
+    @property
+    def day_of_year(self):
+        return self._column('day_of_year')
+
+    @property
+    def month_of_year(self):
+        """Categorical of the month names, missing for the High Mourning Holy Days."""
+        return self._column('month_of_year')
+
+    @property
+    def span_of_month(self):
+        return self._column('span_of_month')
+
+    @property
+    def day_of_span(self):
+        """Categorical of the day of the span names, including the High Mourning Holy Days."""
+        return self._column('day_of_span')
+
+    @property
+    def day_of_month(self):
+        return self._column('day_of_month')
+
+    def to_frame(self):
+        """
+        :return: :pandas.DataFrame:, one column per field, named like the keys of `western_to_aturan`'s :dict:.
+        """
+        return pd.DataFrame({name: self._column(name) for name in _FIELDS})
@@ -0,0 +1,125 @@
+"""
+Spreads very large conversions over a pool of worker processes.
+"""
+import array
+import collections.abc
+import concurrent.futures
+import datetime
+import functools
+import sys
+
+from .core import ATURAN_DAYS_IN_YEAR, _ORIGIN_ORDINAL, _ORIGIN_YEAR, _aturan_date, _normalize_date
+
+
+def _prepare_chunk(dates, tz):
+    # date objects are slow to pickle, much slower than converting them, so plain dates and datetimes are sent as
+    # ordinals. Taking the ordinal is all that normalizing them does. Everything else is normalized by the worker.
+    if tz is None:
+        try:
+            return array.array('i', map(datetime.date.toordinal, dates))
+        except TypeError:
+            pass
+    return dates
+
+
+def _convert_chunk(dates, tz=None):
+    if isinstance(dates, array.array):
+        ordinals = dates
+    elif tz is None:
+        ordinals = map(_normalize_date, dates)
+    else:
+        from .timezones import local_ordinal
+        ordinals = (local_ordinal(dateish, tz) for dateish in dates)
+
+    years = array.array('i')
+    days_of_year = array.array('H')
+    first_year = _ORIGIN_YEAR + 1
+    for ordinal in ordinals:
+        year, idx = divmod(ordinal - _ORIGIN_ORDINAL - 1, ATURAN_DAYS_IN_YEAR)
+        years.append(first_year + year)
+        days_of_year.append(idx + 1)
+    return years, days_of_year
+
+
+class ConvertedDates(collections.abc.Sequence):
+    """
+    The result of `convert_parallel` for a sequence of dates, kept as two `array.array` columns: `years` and
+        `days_of_year`. Items are `AturanDate`, built on access, so millions of results cost a few bytes each.
+    """
+    __slots__ = ('years', 'days_of_year')
+
+    def __init__(self, years=None, days_of_year=None):
+        self.years = array.array('i') if years is None else years
+        self.days_of_year = array.array('H') if days_of_year is None else days_of_year
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return ConvertedDates(self.years[idx], self.days_of_year[idx])
+        return _aturan_date(self.years[idx], self.days_of_year[idx])
+
+    def __len__(self):
+        return len(self.days_of_year)
+
+    def __eq__(self, other):
+        if isinstance(other, ConvertedDates):
+            return self.years == other.years and self.days_of_year == other.days_of_year
+        if isinstance(other, collections.abc.Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return '<ConvertedDates of {} dates>'.format(len(self))
+
+
+def _map(func, values, chunksize, max_workers, executor, prepare=None):
+    chunks = [values[start:start + chunksize] for start in range(0, len(values), chunksize)]
+
+    # Starting a pool costs far more than converting a single chunk in this process.
+    if executor is None and len(chunks) <= 1:
+        return [func(values)]
+
+    if prepare is not None:
+        chunks = [prepare(chunk) for chunk in chunks]
+
+    if executor is not None:
+        return list(executor.map(func, chunks))
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(func, chunks))
+
+
+def convert_parallel(dates, max_workers=None, chunksize=100000, executor=None, tz=None):
+    """
+    Converts a large number of Western/Gregorian dates using a pool of worker processes. The workers normalize and
+        convert the dates, except that plain dates and datetimes in a sequence are sent as ordinals because they are
+        slow to pickle. NumPy arrays are sent in slices as they are. Only compact integer columns are sent back.
+
+    :param dates: Sequence of anything `western_to_aturan` accepts, or a NumPy array accepted by
+        `western_to_aturan_array`.
+    :param max_workers: Integer, the number of worker processes. Defaults to the number of CPUs.
+    :param chunksize: Integer, the number of dates sent to a worker at a time.
+    :param executor: An existing `concurrent.futures.Executor` to use instead of starting a new process pool.
+    :param tz: String or datetime.tzinfo, optional. See `western_to_aturan` and `western_to_aturan_array`.
+    :return: :ConvertedDates:, a read-only sequence of :AturanDate: in the same order as `dates`. For a NumPy array,
+        the same :dict: of :numpy.ndarray: as `western_to_aturan_array`.
+    """
+    if chunksize < 1:
+        raise ValueError('chunksize must be positive, not {}'.format(chunksize))
+
+    numpy = sys.modules.get('numpy')
+    if numpy is not None and isinstance(dates, numpy.ndarray):
+        from .arrays import western_to_aturan_array
+
+        # Slices of the array are sent as they are, so the workers do all of the normalizing, time zones included.
+        results = _map(functools.partial(western_to_aturan_array, tz=tz), dates, chunksize, max_workers, executor)
+        return {key: numpy.concatenate([result[key] for result in results]) for key in results[0]}
+
+    if not isinstance(dates, collections.abc.Sequence):
+        dates = list(dates)
+    result = ConvertedDates()
+    results = _map(functools.partial(_convert_chunk, tz=tz), dates, chunksize, max_workers, executor,
+                   functools.partial(_prepare_chunk, tz=tz))
+    for years, days_of_year in results:
+        result.years.extend(years)
+        result.days_of_year.extend(days_of_year)
+    return result
@@ -0,0 +1,217 @@
+"""
+Renders Aturan months and years as plain text or HTML grids of 4 spans by 11 days, and exports the High Mourning Holy
+Days as iCalendar events.
+
+Every Aturan year has the same layout, so each view is built once as a format string and only the year and the
+Gregorian dates are filled in per call.
+
+    >>> from aturan_calendar import render
+    >>> print(render.text_month(2016, 'Reaping'))
+"""
+import datetime
+import functools
+import html
+
+from .core import (ATURAN_DAY_NAMES, ATURAN_DAYS_IN_MONTH, ATURAN_DAYS_IN_SPAN, ATURAN_DAYS_IN_YEAR,
+                   ATURAN_FIRST_HOLY_DAY, ATURAN_MONTH_OF_YEAR_NAMES, _DAY_TABLE, _MONTHS_IN_YEAR, _SPANS_IN_MONTH,
+                   _aturan_to_ordinal, _month_number)
+
+_HOLY_DAYS = _MONTHS_IN_YEAR + 1
+_HOLY_DAYS_NAME = 'High Mourning'
+
+_TEXT_CELL = 9
+_TEXT_WIDTH = _TEXT_CELL * ATURAN_DAYS_IN_SPAN
+
+
+def _month_name(month):
+    return _HOLY_DAYS_NAME if month == _HOLY_DAYS else ATURAN_MONTH_OF_YEAR_NAMES[month]
+
+
+def _month_days(month):
+    """
+    :return: :range: of the days of the year in a month, or in the High Mourning Holy Days for month 9.
+    """
+    first = (month - 1) * ATURAN_DAYS_IN_MONTH + 1
+    return range(first, min(first + ATURAN_DAYS_IN_MONTH, ATURAN_DAYS_IN_YEAR + 1))
+
+
+# Gregorian dates are filled in through attribute lookups rather than strftime codes, which are several times slower.
+def _iso_field(idx, sep='-'):
+    return '{{{0}.year:04}}{1}{{{0}.month:02}}{1}{{{0}.day:02}}'.format(idx, sep)
+
+
+def _short_field(idx):
+    return '{{{0}.month:02}}-{{{0}.day:02}}'.format(idx)
+
+
+def _dates(year, first_doy, count):
+    first = _aturan_to_ordinal(year, first_doy)
+    return [datetime.date.fromordinal(ordinal) for ordinal in range(first, first + count)]
+
+
+def _text_month_lines(month, offset):
+    # Gregorian dates are positional fields numbered from `offset`, the day of the year before the first one rendered.
+    if month == _HOLY_DAYS:
+        return [
+            '{:<{}}{}'.format(_DAY_TABLE[doy - 1].day_of_span_name, _TEXT_WIDTH - 10, _iso_field(doy - 1 - offset))
+            for doy in _month_days(month)
+        ]
+
+    days = _month_days(month)
+    lines = [''.join('{:>{}}'.format(ATURAN_DAY_NAMES[day], _TEXT_CELL) for day in range(1, ATURAN_DAYS_IN_SPAN + 1))]
+    for span in range(_SPANS_IN_MONTH):
+        span_days = days[span * ATURAN_DAYS_IN_SPAN:(span + 1) * ATURAN_DAYS_IN_SPAN]
+        lines.append(''.join(
+            ' {:>2} {}'.format(_DAY_TABLE[doy - 1].day_of_month, _short_field(doy - 1 - offset)) for doy in span_days
+        ))
+    return lines
+
+
+@functools.lru_cache(maxsize=None)
+def _text_month_template(month):
+    lines = ['{{title:^{}}}'.format(_TEXT_WIDTH)] + _text_month_lines(month, _month_days(month)[0] - 1)
+    return '\n'.join(lines) + '\n'
+
+
+@functools.lru_cache(maxsize=None)
+def _text_year_template():
+    lines = ['{{year:^{}}}'.format(_TEXT_WIDTH)]
+    for month in range(1, _HOLY_DAYS + 1):
+        lines.extend(['', '{:^{}}'.format(_month_name(month), _TEXT_WIDTH)])
+        lines.extend(_text_month_lines(month, 0))
+    return '\n'.join(lines) + '\n'
+
+
+def text_month(year, month):
+    """
+    Renders one month as plain text, in the style of `calendar.TextCalendar`. Each day shows its day of the month and
+        its Gregorian month and day.
+
+    :param year: Integer, the Aturan year.
+    :param month: String or Integer, the month name or number (1-8), or 9 (or '') for the High Mourning Holy Days.
+    :return: :str:
+    """
+    month = _month_number(month)
+    days = _month_days(month)
+    title = '{} {}'.format(_month_name(month), year)
+    return _text_month_template(month).format(*_dates(year, days[0], len(days)), title=title)
+
+
+def text_year(year):
+    """
+    Renders every month of a year and the High Mourning Holy Days as plain text.
+
+    :param year: Integer, the Aturan year.
+    :return: :str:
+    """
+    return _text_year_template().format(*_dates(year, 1, ATURAN_DAYS_IN_YEAR), year=year)
+
+
+def _html_month_table(month, offset):
+    name = _month_name(month)
+    css = 'holy-days' if month == _HOLY_DAYS else 'month {}'.format(name.lower())
+    rows = ['<table class="{}">'.format(css), '<tr><th colspan="{}" class="month-name">{}</th></tr>'.format(
+        ATURAN_DAYS_IN_SPAN, html.escape(name) + ' {year}')]
+
+    if month == _HOLY_DAYS:
+        for doy in _month_days(month):
+            date = _iso_field(doy - 1 - offset)
+            rows.append('<tr><td class="holy-day">{}</td><td><time datetime="{}">{}</time></td></tr>'.format(
+                html.escape(_DAY_TABLE[doy - 1].day_of_span_name), date, date))
+    else:
+        rows.append('<tr>{}</tr>'.format(''.join(
+            '<th class="{}">{}</th>'.format(ATURAN_DAY_NAMES[day].lower(), ATURAN_DAY_NAMES[day])
+            for day in range(1, ATURAN_DAYS_IN_SPAN + 1)
+        )))
+        days = _month_days(month)
+        for span in range(_SPANS_IN_MONTH):
+            span_days = days[span * ATURAN_DAYS_IN_SPAN:(span + 1) * ATURAN_DAYS_IN_SPAN]
+            rows.append('<tr class="span">{}</tr>'.format(''.join(
+                '<td class="{}"><span class="day">{}</span> <time datetime="{}">{}</time></td>'.format(
+                    _DAY_TABLE[doy - 1].day_of_span_name.lower(), _DAY_TABLE[doy - 1].day_of_month,
+                    _iso_field(doy - 1 - offset), _short_field(doy - 1 - offset))
+                for doy in span_days
+            )))
+    rows.append('</table>')
+    return '\n'.join(rows)
+
+
+@functools.lru_cache(maxsize=None)
+def _html_month_template(month):
+    return _html_month_table(month, _month_days(month)[0] - 1) + '\n'
+
+
+@functools.lru_cache(maxsize=None)
+def _html_year_template():
+    tables = [_html_month_table(month, 0) for month in range(1, _HOLY_DAYS + 1)]
+    return '<div class="aturan-year">\n<h1 class="year">{{year}}</h1>\n{}\n</div>\n'.format('\n'.join(tables))
+
+
+def html_month(year, month):
+    """
+    Renders one month as an HTML table with a row per span, in the style of `calendar.HTMLCalendar`. Cells carry the
+        lower case day of the span name as their CSS class and a `<time>` element with the Gregorian date.
+
+    :param year: Integer, the Aturan year.
+    :param month: String or Integer, the month name or number (1-8), or 9 (or '') for the High Mourning Holy Days.
+    :return: :str:
+    """
+    month = _month_number(month)
+    days = _month_days(month)
+    return _html_month_template(month).format(*_dates(year, days[0], len(days)), year=year)
+
+
+def html_year(year):
+    """
+    Renders every month of a year and the High Mourning Holy Days as HTML tables inside a `<div class="aturan-year">`.
+
+    :param year: Integer, the Aturan year.
+    :return: :str:
+    """
+    return _html_year_template().format(*_dates(year, 1, ATURAN_DAYS_IN_YEAR), year=year)
+
+
+def _ics_text(text):
+    return text.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+
+
+@functools.lru_cache(maxsize=None)
+def _ics_year_template():
+    # Field n is the Gregorian date of the nth Holy Day, and the one after the last is where the last event ends.
+    events = []
+    for idx, doy in enumerate(_month_days(_HOLY_DAYS)):
+        events.extend([
+            'BEGIN:VEVENT',
+            'UID:aturan-{{year}}-{}@aturan-calendar'.format(doy),
+            'DTSTAMP:{stamp}',
+            'DTSTART;VALUE=DATE:{}'.format(_iso_field(idx, '')),
+            'DTEND;VALUE=DATE:{}'.format(_iso_field(idx + 1, '')),
+            'SUMMARY:{}'.format(_ics_text(_DAY_TABLE[doy - 1].day_of_span_name)),
+            'TRANSP:TRANSPARENT',
+            'END:VEVENT',
+        ])
+    return '\r\n'.join(events) + '\r\n'
+
+
+def holy_days_ics(years, stamp=None):
+    """
+    Exports the High Mourning Holy Days of one or more years as an iCalendar (.ics) file of all day events.
+
+    :param years: Integer or iterable of Integer, the Aturan years to export.
+    :param stamp: datetime.DateTime, optional. The DTSTAMP of every event, taken as UTC if naive. Defaults to now.
+    :return: :str:, with the CRLF line endings iCalendar requires.
+    """
+    if stamp is None:
+        stamp = datetime.datetime.now(datetime.timezone.utc)
+    elif stamp.tzinfo is not None:
+        stamp = stamp.astimezone(datetime.timezone.utc)
+    stamp = stamp.strftime('%Y%m%dT%H%M%SZ')
+
+    template = _ics_year_template()
+    holy_days = len(_month_days(_HOLY_DAYS))
+    parts = ['BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//aturan-calendar//High Mourning Holy Days//EN\r\n'
+             'CALSCALE:GREGORIAN\r\n']
+    for year in ([years] if isinstance(years, int) else years):
+        parts.append(template.format(*_dates(year, ATURAN_FIRST_HOLY_DAY, holy_days + 1), year=year, stamp=stamp))
+    parts.append('END:VCALENDAR\r\n')
+    return ''.join(parts)
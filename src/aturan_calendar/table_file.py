@@ -0,0 +1,155 @@
+"""
+Precomputed conversion tables stored as fixed-width binary files, so that many processes can share one page-cached
+copy through `mmap` instead of each converting or holding their own.
+
+    $ python -m aturan_calendar.table_file aturan.bin 1600 2400
+"""
+import argparse
+import datetime
+import mmap
+import struct
+
+from .core import AturanDate, _DAY_TABLE, _ORIGIN_ORDINAL, _normalize_date, iter_aturan_range
+
+_MAGIC = b'ATURANTB'
+_VERSION = 1
+
+# magic, version, record size, origin ordinal, first ordinal, number of records
+_HEADER = struct.Struct('<8sHHiii')
+# year, day_of_year, month_of_year, span_of_month, day_of_span, day_of_month. Fields that are None for the High
+# Mourning Holy Days are stored as 0.
+_RECORD = struct.Struct('<iHBBBB')
+
+
+def write_table(path, start, end):
+    """
+    Writes a conversion table covering every day from `start` to `end`, both included.
+
+    :param path: String, the file to write.
+    :param start: datetime.Date, datetime.DateTime, Arrow, ISO 8601 String, or Unix timestamp in seconds. The first
+        date in the table.
+    :param end: datetime.Date, datetime.DateTime, Arrow, ISO 8601 String, or Unix timestamp in seconds. The last date
+        in the table.
+    :return: :int:, the number of days written.
+    """
+    first = _normalize_date(start)
+    count = _normalize_date(end) - first + 1
+    if count < 1:
+        raise ValueError('end must not be before start')
+
+    data = bytearray(_HEADER.size + count * _RECORD.size)
+    _HEADER.pack_into(data, 0, _MAGIC, _VERSION, _RECORD.size, _ORIGIN_ORDINAL, first, count)
+    offset = _HEADER.size
+    for date in iter_aturan_range(start, end):
+        info = _DAY_TABLE[date.day_of_year - 1]
+        month = 0 if info.month_of_year_name is None else info.month_of_year
+        _RECORD.pack_into(data, offset, date.year, date.day_of_year, month, info.span_of_month_num or 0,
+                          info.day_of_span, info.day_of_month_num or 0)
+        offset += _RECORD.size
+
+    with open(path, 'wb') as f:
+        f.write(data)
+    return count
+
+
+class ConversionTable:
+    """
+    A read-only, memory mapped view of a file written by `write_table`. Lookups read one fixed-width record at a known
+        offset, so nothing is parsed or converted per call.
+
+    :param path: String, the file to open.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._map) < _HEADER.size:
+            self.close()
+            raise ValueError('{} is not a version {} conversion table'.format(path, _VERSION))
+        magic, version, record_size, origin, self.first_ordinal, self.count = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC or version != _VERSION or record_size != _RECORD.size:
+            self.close()
+            raise ValueError('{} is not a version {} conversion table'.format(path, _VERSION))
+        if origin != _ORIGIN_ORDINAL:
+            self.close()
+            raise ValueError('{} was written for a different origin'.format(path))
+        if len(self._map) != _HEADER.size + self.count * _RECORD.size:
+            self.close()
+            raise ValueError('{} should hold {} records but is {} bytes long'.format(path, self.count, len(self._map)))
+
+    @property
+    def start(self):
+        return datetime.date.fromordinal(self.first_ordinal)
+
+    @property
+    def end(self):
+        return datetime.date.fromordinal(self.first_ordinal + self.count - 1)
+
+    def record_ordinal(self, ordinal):
+        """
+        Looks up a record by proleptic Gregorian ordinal (see `datetime.date.toordinal`), with nothing to parse.
+
+        :param ordinal: Integer, the ordinal of the date to look up.
+        :return: :tuple:, the raw stored fields: year, day_of_year, month_of_year, span_of_month, day_of_span, and
+            day_of_month, with 0 in place of None.
+        """
+        idx = ordinal - self.first_ordinal
+        if not 0 <= idx < self.count:
+            raise KeyError(ordinal)
+        return _RECORD.unpack_from(self._map, _HEADER.size + idx * _RECORD.size)
+
+    def lookup_ordinal(self, ordinal):
+        """
+        :param ordinal: Integer, the proleptic Gregorian ordinal of the date to look up.
+        :return: :AturanDate:
+        """
+        year, doy, _, _, _, _ = self.record_ordinal(ordinal)
+        return AturanDate(year, doy)
+
+    def record(self, dateish):
+        """
+        :param dateish: datetime.Date, datetime.DateTime, Arrow, ISO 8601 String, or Unix timestamp in seconds. The date
+            to look up. Integers are taken as timestamps; use `record_ordinal` for ordinals.
+        :return: :tuple:, see `record_ordinal`.
+        """
+        try:
+            return self.record_ordinal(_normalize_date(dateish))
+        except KeyError:
+            raise KeyError(dateish) from None
+
+    def lookup(self, dateish):
+        """
+        :param dateish: datetime.Date, datetime.DateTime, Arrow, ISO 8601 String, or Unix timestamp in seconds. The date
+            to look up. Integers are taken as timestamps; use `lookup_ordinal` for ordinals.
+        :return: :AturanDate:
+        """
+        year, doy, _, _, _, _ = self.record(dateish)
+        return AturanDate(year, doy)
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Precompute an Aturan conversion table file.')
+    parser.add_argument('path', help='the file to write')
+    parser.add_argument('first_year', type=int, help='first Western/Gregorian year in the table')
+    parser.add_argument('last_year', type=int, help='last Western/Gregorian year in the table')
+    args = parser.parse_args(argv)
+
+    count = write_table(args.path, datetime.date(args.first_year, 1, 1), datetime.date(args.last_year, 12, 31))
+    print('wrote {} days to {}'.format(count, args.path))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+"""
+Turns instants into local days for a time zone, using UTC offset transition tables that are built once per zone and
+span of time instead of asking the tzinfo for every conversion.
+"""
+import bisect
+import datetime
+import sys
+import threading
+import zoneinfo
+
+from .core import _UNIX_EPOCH_ORDINAL, _normalize_date
+
+_SECONDS_PER_DAY = 24 * 60 * 60
+# Tables are built in chunks of roughly a year. Offsets are sampled every few hours inside a chunk and each change is
+# then narrowed down to the exact second, so only zones changing offset twice within one sample are misread.
+_CHUNK_SECONDS = 1 << 25
+_SAMPLE_SECONDS = 4 * 60 * 60
+
+_UTC_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+# Offsets are only looked up inside the range datetime can hold in any zone. Chunks at either end reuse the offset at
+# the nearest edge.
+_FIRST_SECOND = int((datetime.datetime.min.replace(tzinfo=datetime.timezone.utc) - _UTC_EPOCH).total_seconds()) + \
+    _SECONDS_PER_DAY
+_LAST_SECOND = int((datetime.datetime.max.replace(tzinfo=datetime.timezone.utc) - _UTC_EPOCH).total_seconds()) - \
+    _SECONDS_PER_DAY
+# NumPy stores NaT as the smallest int64.
+_NAT = -(1 << 63)
+
+_tables = {}
+_tables_lock = threading.Lock()
+
+
+def _resolve(tz):
+    if isinstance(tz, str):
+        return datetime.timezone.utc if tz.upper() == 'UTC' else zoneinfo.ZoneInfo(tz)
+    if isinstance(tz, datetime.tzinfo):
+        return tz
+    raise TypeError('tz must be a time zone name or a datetime.tzinfo, not {!r}'.format(tz))
+
+
+class _TransitionTable:
+
+    def __init__(self, tz):
+        self._tz = tz
+        self._chunks = {}
+
+    def _offset_at(self, seconds):
+        return int((_UTC_EPOCH + datetime.timedelta(seconds=seconds)).astimezone(self._tz).utcoffset().total_seconds())
+
+    def chunk(self, number):
+        """
+        :return: :tuple: of two :list:, the UTC seconds at which each offset starts and the offsets themselves, for
+            one chunk of time. The first start is always the start of the chunk.
+        """
+        table = self._chunks.get(number)
+        if table is None:
+            table = self._chunks[number] = self._build(number)
+        return table
+
+    def _build(self, number):
+        start = number * _CHUNK_SECONDS
+        first = max(start, _FIRST_SECOND)
+        last = min(start + _CHUNK_SECONDS - 1, _LAST_SECOND)
+        starts = [start]
+        offsets = [self._offset_at(min(first, _LAST_SECOND))]
+
+        previous = first
+        for sample in range(first + _SAMPLE_SECONDS, last + _SAMPLE_SECONDS, _SAMPLE_SECONDS):
+            sample = min(sample, last)
+            offset = self._offset_at(sample)
+            if offset != offsets[-1]:
+                low, high = previous, sample
+                while high - low > 1:
+                    middle = (low + high) // 2
+                    if self._offset_at(middle) == offsets[-1]:
+                        low = middle
+                    else:
+                        high = middle
+                starts.append(high)
+                offsets.append(offset)
+            previous = sample
+        return starts, offsets
+
+    def offset(self, seconds):
+        number = int(seconds // _CHUNK_SECONDS)
+        starts, offsets = self._chunks.get(number) or self.chunk(number)
+        return offsets[bisect.bisect_right(starts, seconds) - 1]
+
+
+def transition_table(tz):
+    """
+    :param tz: String or datetime.tzinfo, an IANA time zone name such as 'America/New_York', or a tzinfo.
+    :return: The cached transition table for the zone.
+    """
+    table = _tables.get(tz)
+    if table is None:
+        resolved = _resolve(tz)
+        with _tables_lock:
+            # Keep the table under both the name and the tzinfo so later lookups skip resolving the zone again.
+            table = _tables.setdefault(resolved, _TransitionTable(resolved))
+            _tables[tz] = table
+    return table
+
+
+def _timestamp(dateish):
+    if isinstance(dateish, (int, float)) and not isinstance(dateish, bool):
+        return dateish
+
+    if isinstance(dateish, datetime.datetime):
+        if dateish.tzinfo is None:
+            dateish = dateish.replace(tzinfo=datetime.timezone.utc)
+        return (dateish - _UTC_EPOCH).total_seconds()
+
+    if isinstance(dateish, str) and len(dateish) > 10:
+        return _timestamp(datetime.datetime.fromisoformat(dateish))
+
+    arrow = sys.modules.get('arrow')
+    if arrow is not None and isinstance(dateish, arrow.Arrow):
+        return dateish.timestamp()
+
+    return None
+
+
+def local_ordinal(dateish, tz, epoch_unit='seconds'):
+    """
+    Returns the proleptic Gregorian ordinal of the day on which an instant falls in a time zone. Naive datetimes are
+        taken as UTC. Plain dates, date-only Strings, and Unix timestamps in days have no time of day and are returned
+        as they are.
+    """
+    if epoch_unit != 'seconds' and isinstance(dateish, (int, float)):
+        return _normalize_date(dateish, epoch_unit)
+
+    seconds = _timestamp(dateish)
+    if seconds is None:
+        return _normalize_date(dateish, epoch_unit)
+    return _UNIX_EPOCH_ORDINAL + int((seconds + transition_table(tz).offset(seconds)) // _SECONDS_PER_DAY)
+
+
+def local_days(seconds, tz):
+    """
+    Vectorized `local_ordinal` for NumPy arrays of Unix timestamps in seconds.
+
+    :return: :numpy.ndarray: of proleptic Gregorian ordinals. NaT, i.e. the smallest int64, is left as it is.
+    """
+    import numpy as np
+
+    table = transition_table(tz)
+    seconds = np.asarray(seconds, dtype=np.int64)
+    missing = seconds == _NAT
+    present = seconds[~missing]
+
+    # Every chunk starts with its own first second, so the chunks in use can be joined into one sorted table.
+    starts = []
+    offsets = []
+    for number in np.unique(present // _CHUNK_SECONDS).tolist():
+        chunk_starts, chunk_offsets = table.chunk(number)
+        starts.extend(chunk_starts)
+        offsets.extend(chunk_offsets)
+
+    result = np.full(seconds.shape, _NAT, dtype=np.int64)
+    if present.size:
+        idx = np.searchsorted(np.array(starts, dtype=np.int64), present, side='right') - 1
+        result[~missing] = (present + np.array(offsets, dtype=np.int64)[idx]) // _SECONDS_PER_DAY + _UNIX_EPOCH_ORDINAL
+    return result
@@ -0,0 +1,131 @@
+import asyncio
+import datetime
+import threading
+
+import pytest
+
+import aturan_calendar as cal
+from aturan_calendar import aio
+
+
+def _dates(count):
+    start = datetime.date(2016, 1, 1)
+    return [start + datetime.timedelta(days=i % 40) for i in range(count)]
+
+
+def test_batches_concurrent_requests():
+    converter = cal.BatchingConverter(window=0.01)
+    dates = _dates(200)
+
+    async def run():
+        return await asyncio.gather(*[converter.western_to_aturan_date(day) for day in dates])
+
+    result = asyncio.run(run())
+
+    assert result == [cal.western_to_aturan(day) for day in dates]
+    stats = converter.stats()
+    assert stats['requests'] == 200
+    assert stats['batches'] == 1
+    assert stats['pending'] == 0
+    assert stats['mean_batch_size'] == 200
+    assert stats['requests_per_second'] > stats['batches_per_second'] > 0
+
+
+def test_max_batch_flushes_early():
+    converter = cal.BatchingConverter(window=10, max_batch=50)
+    dates = _dates(120)
+
+    async def run():
+        return await asyncio.wait_for(asyncio.gather(*[converter.western_to_aturan_date(day) for day in dates]), 0.2)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(run())
+    assert converter.stats()['batches'] == 2
+    # The 20 left waiting were cancelled by the timeout.
+    assert converter.stats()['pending'] == 0
+
+
+def test_reused_across_event_loops():
+    converter = cal.BatchingConverter(window=10, max_batch=50)
+
+    async def abandon():
+        await asyncio.wait_for(converter.western_to_aturan_date(datetime.date(2007, 3, 27)), 0.01)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(abandon())
+
+    converter.window = 0.001
+
+    async def run():
+        return await asyncio.wait_for(converter.western_to_aturan_date(datetime.date(2016, 4, 14)), 1)
+
+    assert asyncio.run(run())['day_of_year'] == 303
+    assert converter.stats()['requests'] == 1
+
+
+def test_converts_each_input_once(monkeypatch):
+    calls = []
+
+    def normalize(dateish):
+        calls.append(dateish)
+        return cal.core._normalize_date(dateish)
+
+    monkeypatch.setattr(aio, '_normalize_date', normalize)
+    converter = cal.BatchingConverter(window=0.01)
+    dates = _dates(200)
+
+    async def run():
+        return await asyncio.gather(*[converter.western_to_aturan_date(day) for day in dates])
+
+    assert asyncio.run(run()) == [cal.western_to_aturan_date(day) for day in dates]
+    assert sorted(calls) == sorted(set(dates))
+
+
+def test_event_loops_in_threads():
+    converter = cal.BatchingConverter(window=0.05)
+    results = {}
+    started = threading.Barrier(2)
+
+    def worker(name, day):
+        async def run():
+            started.wait()
+            return await asyncio.wait_for(converter.western_to_aturan_date(day), 1)
+        results[name] = asyncio.run(run())
+
+    threads = [threading.Thread(target=worker, args=('a', datetime.date(2007, 3, 27))),
+               threading.Thread(target=worker, args=('b', datetime.date(2016, 4, 14)))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results['a']['day_of_year'] == 228
+    assert results['b']['day_of_year'] == 303
+    assert converter.stats()['requests'] == 2
+    assert converter.stats()['batches'] == 2
+
+
+def test_separate_windows():
+    converter = cal.BatchingConverter(window=0.001)
+
+    async def run():
+        first = await converter.western_to_aturan_date(datetime.date(2007, 3, 27))
+        second = await converter.western_to_aturan_date(datetime.date(2016, 4, 14))
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first['day_of_year'] == 228
+    assert second['day_of_year'] == 303
+    assert converter.stats()['batches'] == 2
+    assert converter.stats()['max_latency'] >= 0.001
+
+
+def test_bad_type_raises_immediately():
+    converter = cal.BatchingConverter()
+
+    async def run():
+        await converter.western_to_aturan_date(object())
+
+    with pytest.raises(TypeError):
+        asyncio.run(run())
+    assert converter.stats()['pending'] == 0
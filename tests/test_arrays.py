@@ -0,0 +1,89 @@
+import datetime
+
+import pytest
+
+import aturan_calendar as cal
+
+np = pytest.importorskip('numpy')
+
+
+def _expected(day):
+    entry = cal.western_to_aturan(day)
+    is_holy = entry['day_of_year'] >= cal.ATURAN_FIRST_HOLY_DAY
+    return {
+        'year': entry['year'],
+        'day_of_year': entry['day_of_year'],
+        'month_of_year': 0 if is_holy else cal.month_of_year(entry['day_of_year']),
+        'span_of_month': entry['span_of_month'] or 0,
+        'day_of_span': cal.day_of_span(entry['day_of_year']),
+        'day_of_month': entry['day_of_month'] or 0,
+    }
+
+
+def test_western_to_aturan_array_matches_scalar():
+    start = np.datetime64('1990-01-01')
+    dates = np.arange(start, start + 4000)
+
+    result = cal.western_to_aturan_array(dates)
+
+    for idx, value in enumerate(dates.tolist()):
+        expected = _expected(value)
+        actual = {k: int(v[idx]) for k, v in result.items()}
+        assert actual == expected, 'wrong for {}'.format(value)
+
+
+def test_western_to_aturan_array_inputs():
+    days = [datetime.date(2007, 3, 27), datetime.date(2016, 4, 14), datetime.date(1850, 6, 1)]
+    expected = cal.western_to_aturan_array(np.array(days, dtype='datetime64[D]'))
+
+    from_ordinals = cal.western_to_aturan_array(np.array([d.toordinal() for d in days]))
+    from_objects = cal.western_to_aturan_array(days)
+    from_minutes = cal.western_to_aturan_array(np.array(['2007-03-27T23:59', '2016-04-14T00:01', '1850-06-01T12:00'],
+                                                        dtype='datetime64[m]'))
+
+    for result in (from_ordinals, from_objects, from_minutes):
+        for key in expected:
+            assert (result[key] == expected[key]).all(), key
+
+    assert expected['year'].tolist() == [2007, 2016, 1848]
+    assert expected['day_of_year'].tolist()[:2] == [228, 303]
+
+
+def test_western_to_aturan_array_aware_datetimes():
+    tokyo = datetime.timezone(datetime.timedelta(hours=9))
+    days = [datetime.datetime(2007, 3, 27, 1, tzinfo=tokyo), datetime.datetime(2016, 4, 14, 23, tzinfo=tokyo)]
+
+    result = cal.western_to_aturan_array(days)
+
+    assert result['day_of_year'].tolist() == [cal.western_to_aturan(day)['day_of_year'] for day in days] == [228, 303]
+
+
+def test_western_to_aturan_array_bad_type():
+    with pytest.raises(TypeError):
+        cal.western_to_aturan_array(np.array([1.5, 2.5]))
+
+
+def test_western_to_aturan_array_missing():
+    for dates in (np.array(['2007-03-27', 'NaT'], dtype='datetime64[D]'),
+                  np.array(['2007-03-27T12:00', 'NaT'], dtype='datetime64[s]'),
+                  np.array([datetime.date(2007, 3, 27), None], dtype=object)):
+        with pytest.raises(ValueError):
+            cal.western_to_aturan_array(dates)
+    with pytest.raises(ValueError):
+        cal.western_to_aturan_array(np.array(['2007-03-27', 'NaT'], dtype='datetime64[s]'), tz='America/New_York')
+
+
+def test_aturan_to_western_array_round_trip():
+    start = np.datetime64('1700-01-01')
+    dates = np.arange(start, start + 200000)
+
+    result = cal.western_to_aturan_array(dates)
+    back = cal.aturan_to_western_array(result['year'], result['day_of_year'])
+
+    assert back.dtype == np.dtype('datetime64[D]')
+    assert (back == dates).all()
+
+
+def test_aturan_to_western_array_bad_day():
+    with pytest.raises(ValueError):
+        cal.aturan_to_western_array([2007, 2007], [1, 360])
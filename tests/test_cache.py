@@ -0,0 +1,64 @@
+import datetime
+import threading
+
+import arrow
+
+import aturan_calendar as cal
+
+
+def test_cache_hits_and_misses():
+    cache = cal.ConversionCache(maxsize=10)
+
+    result = cache.western_to_aturan_date(datetime.date(2007, 3, 27))
+    assert result == cal.western_to_aturan(datetime.date(2007, 3, 27))
+    assert cache.stats() == {'hits': 0, 'misses': 1, 'size': 1, 'maxsize': 10}
+
+    assert cache.western_to_aturan_date(datetime.datetime(2007, 3, 27, 18, 30)) is result
+    assert cache.western_to_aturan_date(arrow.get(2007, 3, 27)) is result
+    assert cache.stats() == {'hits': 2, 'misses': 1, 'size': 1, 'maxsize': 10}
+
+
+def test_cache_evicts_least_recently_used():
+    cache = cal.ConversionCache(maxsize=2)
+    first = datetime.date(2016, 4, 14)
+
+    cache.western_to_aturan_date(first)
+    cache.western_to_aturan_date(datetime.date(2016, 4, 15))
+    cache.western_to_aturan_date(first)
+    cache.western_to_aturan_date(datetime.date(2016, 4, 16))
+    assert cache.stats()['size'] == 2
+
+    cache.western_to_aturan_date(first)
+    assert cache.stats()['hits'] == 2
+
+
+def test_cache_clear():
+    cache = cal.ConversionCache()
+    cache.western_to_aturan_date(datetime.date(2016, 4, 14))
+    cache.western_to_aturan_date(datetime.date(2016, 4, 14))
+
+    cache.clear()
+    assert cache.stats() == {'hits': 0, 'misses': 0, 'size': 0, 'maxsize': 1024}
+
+
+def test_cache_threads():
+    cache = cal.ConversionCache(maxsize=16)
+    days = [datetime.date(2016, 1, 1) + datetime.timedelta(days=i) for i in range(32)]
+    errors = []
+
+    def work():
+        for _ in range(50):
+            for day in days:
+                if cache.western_to_aturan_date(day) != cal.western_to_aturan(day):
+                    errors.append(day)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert errors == []
+    assert stats['hits'] + stats['misses'] == 8 * 50 * len(days)
+    assert stats['size'] <= 16
@@ -1,4 +1,8 @@
+import copy
 import datetime
+import json
+import pickle
+
 import arrow
 import pytest
 
@@ -592,6 +596,15 @@ def test_span_of_month_num():
             assert result == datum['span'], "{} should be {}, not {}".format(day_plus_year, datum['span'], result)
 
 
+def test_field_functions_normalize_any_day():
+    for doy in range(1, cal.ATURAN_DAYS_IN_YEAR + 1):
+        for other in (doy - cal.ATURAN_DAYS_IN_YEAR, doy + 3 * cal.ATURAN_DAYS_IN_YEAR):
+            assert cal.month_of_year_name(other) == cal.month_of_year_name(doy)
+            assert cal.span_of_month_num(other) == cal.span_of_month_num(doy)
+            assert cal.day_of_span_name(other) == cal.day_of_span_name(doy)
+            assert cal.day_of_month_num(other) == cal.day_of_month_num(doy)
+
+
 class TestWesternToAturan:
 
     PUBLISHED = {
@@ -632,9 +645,115 @@ class TestWesternToAturan:
         result = cal.western_to_aturan(arrow.get(2016, 4, 14))
         assert result == self.BIRTHDAY
 
+    def test_with_iso_string(self):
+        assert cal.western_to_aturan('2007-03-27') == self.PUBLISHED
+        assert cal.western_to_aturan('2016-04-14T23:59:59+05:00') == self.BIRTHDAY
+        assert cal.western_to_aturan('2016-04-14 08:00') == self.BIRTHDAY
+
+    def test_with_bad_iso_string(self):
+        for text in ('2016-02-30', '2016-13-01', 'yesterday', '2016-04-14garbage', '2016-04-14Tnonsense',
+                     '2016-04-14 a,"b"', '2016-04-14T08:00:61', ''):
+            with pytest.raises(ValueError):
+                cal.western_to_aturan(text)
+
+    def test_iso_string_every_day(self):
+        day = datetime.date(1999, 1, 1)
+        for _ in range(3 * 366):
+            assert cal.western_to_aturan(day.isoformat()) == cal.western_to_aturan(day)
+            day += datetime.timedelta(days=1)
+
+    def test_with_epoch_seconds(self):
+        published = datetime.datetime(2007, 3, 27, tzinfo=datetime.timezone.utc).timestamp()
+        assert cal.western_to_aturan(int(published)) == self.PUBLISHED
+        assert cal.western_to_aturan(published + 86399.5) == self.PUBLISHED
+        assert cal.western_to_aturan(published - 1)['day_of_year'] == 227
+        assert cal.western_to_aturan(-1)['year'] == cal.western_to_aturan(datetime.date(1969, 12, 31))['year']
+
+    def test_with_epoch_days(self):
+        days = (datetime.date(2016, 4, 14) - datetime.date(1970, 1, 1)).days
+        assert cal.western_to_aturan(days, epoch_unit='days') == self.BIRTHDAY
+        assert cal.western_to_aturan_date(days, epoch_unit='days') == self.BIRTHDAY
+        with pytest.raises(ValueError):
+            cal.western_to_aturan(days, epoch_unit='weeks')
+
     def test_with_bad_type(self):
+        for value in (None, True, [2007, 3, 27], object()):
+            with pytest.raises(TypeError):
+                cal.western_to_aturan(value)
+
+    def test_with_arrow_in_other_timezone(self):
+        result = cal.western_to_aturan(arrow.get(2007, 3, 27, tzinfo='Asia/Tokyo'))
+        assert result == self.PUBLISHED
+
+        result = cal.western_to_aturan(arrow.get(2016, 4, 14, 23, 59, tzinfo='America/Los_Angeles'))
+        assert result == self.BIRTHDAY
+
+    def test_matches_arrow_arithmetic(self):
+        # The ordinal fast path must agree with plain Arrow day arithmetic for every day, on both sides of _ORIGIN.
+        calendar = cal.full_calendar()
+        day = datetime.date(1800, 1, 1)
+        end = datetime.date(2200, 12, 31)
+        one = datetime.timedelta(days=1)
+        while day <= end:
+            days = (arrow.Arrow.fromdate(day) - cal._ORIGIN).days
+            expected = dict(calendar[(days - 1) % cal.ATURAN_DAYS_IN_YEAR + 1])
+            expected['year'] = 2007 + (days - 1) // cal.ATURAN_DAYS_IN_YEAR
+
+            result = cal.western_to_aturan(day)
+            assert result == expected, "wrong for {}".format(day)
+            day += one
+
+
+class TestAturanDate:
+
+    def test_matches_dict(self):
+        result = cal.western_to_aturan_date(datetime.date(2007, 3, 27))
+        assert result == TestWesternToAturan.PUBLISHED
+        assert result.as_dict() == TestWesternToAturan.PUBLISHED
+        assert dict(result) == TestWesternToAturan.PUBLISHED
+        assert result['day_of_span'] == 'Felling'
+        assert result.month_of_year == 'Reaping'
+
+    def test_every_day_matches_western_to_aturan(self):
+        day = datetime.date(2006, 1, 1)
+        for _ in range(2 * cal.ATURAN_DAYS_IN_YEAR):
+            assert cal.western_to_aturan_date(day).as_dict() == cal.western_to_aturan(day)
+            day += datetime.timedelta(days=1)
+
+    def test_holy_day(self):
+        result = cal.AturanDate(2016, 359)
+        assert result.month_of_year is None
+        assert result.span_of_month is None
+        assert result.day_of_month is None
+        assert result.day_of_span == 'High Mourning Day #7 (Winter\'s Solstice)'
+
+    def test_immutable_and_hashable(self):
+        result = cal.AturanDate(2007, 228)
+        with pytest.raises(AttributeError):
+            result.year = 2008
         with pytest.raises(TypeError):
-            result = cal.western_to_aturan(1)
+            result['year'] = 2008
+
+        assert result == cal.AturanDate(2007, 228)
+        assert result != cal.AturanDate(2008, 228)
+        assert len({result, cal.AturanDate(2007, 228), cal.AturanDate(2007, 229)}) == 2
+
+    def test_converted_dates_are_immutable(self):
+        result = cal.western_to_aturan_date(datetime.date(2007, 3, 27))
+        with pytest.raises(AttributeError):
+            result.year = 2008
+        assert hash(result) == hash(cal.AturanDate(2007, 228))
+        assert pickle.loads(pickle.dumps(result)) == result
+
+    def test_pickle(self):
+        result = cal.AturanDate(2007, 228)
+        assert pickle.loads(pickle.dumps(result)) == result
+
+    def test_bad_day_of_year(self):
+        with pytest.raises(ValueError):
+            cal.AturanDate(2007, 0)
+        with pytest.raises(ValueError):
+            cal.AturanDate(2007, 360)
 
 
 def test_full_calendar():
@@ -674,6 +793,75 @@ def test_full_calendar():
     assert len(result) == cal.ATURAN_DAYS_IN_YEAR
     for k, v in expected.items():
         assert result[k] == v
+    assert cal.full_calendar(copy=True) == result
+
+
+def test_full_calendar_is_shared_and_read_only():
+    result = cal.full_calendar()
+
+    assert cal.full_calendar() is result
+    with pytest.raises(TypeError):
+        result[1] = {}
+    with pytest.raises(TypeError):
+        result[1]['year'] = 2016
+    for change in (lambda d: d.update(year=2016), lambda d: d.pop('day_of_year'), lambda d: d.clear(),
+                   lambda d: d.setdefault('year', 2016), lambda d: d.popitem()):
+        with pytest.raises(TypeError):
+            change(result)
+        with pytest.raises(TypeError):
+            change(result[1])
+    with pytest.raises(TypeError):
+        del result[1]
+    assert len(result) == cal.ATURAN_DAYS_IN_YEAR
+
+    copied = cal.full_calendar(copy=True)
+    assert type(copied) is dict and all(type(entry) is dict for entry in copied.values())
+    assert copied is not cal.full_calendar(copy=True)
+    copied[1]['year'] = 2016
+    assert 'year' not in result[1]
+
+
+def test_full_calendar_serializes():
+    result = cal.full_calendar()
+    expected = cal.full_calendar(copy=True)
+
+    assert json.loads(json.dumps(result)) == json.loads(json.dumps(expected))
+    for other in (pickle.loads(pickle.dumps(result)), copy.deepcopy(result), copy.copy(result)):
+        assert other == expected
+        with pytest.raises(TypeError):
+            other[1]['year'] = 2016
+
+
+def test_entries_match_field_formulas():
+    # Every field worked out separately, the way the calendar was first written.
+    def reference(doy):
+        month = (doy - 1) // cal.ATURAN_DAYS_IN_MONTH + 1
+        dom = doy - (month - 1) * cal.ATURAN_DAYS_IN_MONTH
+        dos = doy % cal.ATURAN_DAYS_IN_SPAN or cal.ATURAN_DAYS_IN_SPAN
+        if doy >= cal.ATURAN_FIRST_HOLY_DAY:
+            name = 'High Mourning Day #{}'.format(doy - cal.ATURAN_FIRST_HOLY_DAY + 1)
+            if doy == cal.ATURAN_WINTERS_SOLSTICE_DAY:
+                name += " (Winter's Solstice)"
+            return {'day_of_year': doy, 'month_of_year': None, 'span_of_month': None, 'day_of_span': name,
+                    'day_of_month': None}
+        return {'day_of_year': doy, 'month_of_year': cal.ATURAN_MONTH_OF_YEAR_NAMES[month],
+                'span_of_month': (dom - 1) // cal.ATURAN_DAYS_IN_SPAN + 1, 'day_of_span': cal.ATURAN_DAY_NAMES[dos],
+                'day_of_month': dom}
+
+    calendar = cal.full_calendar()
+    first = cal.aturan_to_western(2016, 1)
+    for doy in range(1, cal.ATURAN_DAYS_IN_YEAR + 1):
+        expected = reference(doy)
+        assert calendar[doy] == expected
+        assert cal.core._create_entry(doy + cal.ATURAN_DAYS_IN_YEAR) == expected
+        assert cal.western_to_aturan(first + datetime.timedelta(days=doy - 1)) == dict(expected, year=2016)
+
+    # Entries are copies, so changing one does not change the next.
+    calendar = cal.full_calendar(copy=True)
+    calendar[1]['year'] = 1
+    assert 'year' not in cal.full_calendar()[1]
+    assert 'year' not in cal.full_calendar(copy=True)[1]
+    assert 'year' not in cal.core._create_entry(1)
 
 
 def test_aturan_calendar_for_western_year():
@@ -715,3 +903,285 @@ def test_aturan_calendar_for_western_year():
     result = cal.aturan_calendar_for_western_year(2016)
     for k in sorted(expected.keys()):
         assert result[k] == expected[k], 'wrong for entry #{}'.format(k)
+
+
+def test_western_year_calendar():
+    for year in (1600, 1900, 2006, 2007, 2016, 2100):
+        result = cal.western_year_calendar(year)
+        dicts = cal.aturan_calendar_for_western_year(year)
+
+        day = datetime.date(year, 1, 1)
+        assert len(result) == len(dicts) == (datetime.date(year + 1, 1, 1) - day).days
+        for idx in range(1, len(result) + 1):
+            expected = cal.western_to_aturan(day)
+            assert result[idx] == expected, 'wrong for {}'.format(day)
+            assert dicts[idx] == expected, 'wrong for {}'.format(day)
+            day += datetime.timedelta(days=1)
+
+    with pytest.raises(KeyError):
+        result[0]
+    assert list(result)[0] == 1
+
+
+def test_western_year_segments():
+    for year in (1600, 1811, 1900, 2006, 2007, 2016, 2100, 2357):
+        calendar = cal.western_year_calendar(year)
+        segments = calendar.segments()
+
+        assert [aturan_year for aturan_year, _, _ in segments] == list(cal.aturan_years_for_western_year(year))
+        assert segments[0][1] == 1
+        assert segments[-1][2] == len(calendar)
+        for aturan_year, first, last in segments:
+            assert {calendar[idx].year for idx in range(first, last + 1)} == {aturan_year}
+        for (_, _, last), (_, first, _) in zip(segments, segments[1:]):
+            assert first == last + 1
+    # A Gregorian year is longer than an Aturan year, so it can overlap three of them.
+    assert [year for year, _, _ in cal.western_year_calendar(1811).segments()] == [1807, 1808, 1809]
+
+
+def test_aturan_year_bounds():
+    assert cal.aturan_year_bounds(2007) == (datetime.date(2006, 8, 12), datetime.date(2007, 8, 5))
+    for year in (1, 1999, 2006, 2007, 2008, 2500):
+        first, last = cal.aturan_year_bounds(year)
+        assert cal.western_to_aturan_date(first) == cal.AturanDate(year, 1)
+        assert cal.western_to_aturan_date(last) == cal.AturanDate(year, cal.ATURAN_DAYS_IN_YEAR)
+        assert cal.western_to_aturan_date(first - datetime.timedelta(days=1)).year == year - 1
+        assert cal.western_to_aturan_date(last + datetime.timedelta(days=1)).year == year + 1
+
+
+class TestAturanToWestern:
+
+    def test_known_dates(self):
+        assert cal.aturan_to_western(2007, 228) == datetime.date(2007, 3, 27)
+        assert cal.aturan_to_western(2016, 303) == datetime.date(2016, 4, 14)
+        assert cal.AturanDate(2016, 303).to_western() == datetime.date(2016, 4, 14)
+
+    def test_round_trip_from_western(self):
+        day = datetime.date(1700, 1, 1)
+        end = datetime.date(2300, 1, 1)
+        while day < end:
+            result = cal.western_to_aturan(day)
+            assert cal.aturan_to_western(result['year'], result['day_of_year']) == day
+            day += datetime.timedelta(days=1)
+
+    def test_round_trip_from_aturan(self):
+        for year in (1, 1500, 2006, 2007, 2008, 2500):
+            for doy in range(1, cal.ATURAN_DAYS_IN_YEAR + 1):
+                result = cal.western_to_aturan(cal.aturan_to_western(year, doy))
+                assert (result['year'], result['day_of_year']) == (year, doy)
+
+    def test_parts(self):
+        assert cal.aturan_parts_to_western(2007, 'Reaping', 1, 'Felling') == datetime.date(2007, 3, 27)
+        assert cal.aturan_parts_to_western(2007, 6, 1, 8) == datetime.date(2007, 3, 27)
+        assert cal.aturan_parts_to_western(2016, 'Fallow', 4, 'Hepten') == datetime.date(2016, 4, 14)
+
+    def test_parts_round_trip(self):
+        for doy in range(1, cal.ATURAN_DAYS_IN_YEAR + 1):
+            day = cal.aturan_to_western(2010, doy)
+            result = cal.aturan_parts_to_western(2010, cal.month_of_year(doy), cal.span_of_month(doy),
+                                                 cal.day_of_span(doy))
+            assert result == day
+            if doy < cal.ATURAN_FIRST_HOLY_DAY:
+                result = cal.aturan_parts_to_western(2010, cal.month_of_year_name(doy), cal.span_of_month_num(doy),
+                                                     cal.day_of_span_name(doy))
+                assert result == day
+
+    def test_holy_days(self):
+        assert cal.western_to_aturan(cal.aturan_parts_to_western(2016, 9, 1, 7))['day_of_year'] == 359
+        assert cal.western_to_aturan(cal.aturan_parts_to_western(2016, '', 1, 1))['day_of_year'] == 353
+
+    def test_bad_values(self):
+        with pytest.raises(ValueError):
+            cal.aturan_to_western(2007, 0)
+        with pytest.raises(ValueError):
+            cal.aturan_to_western(2007, 360)
+        with pytest.raises(ValueError):
+            cal.aturan_parts_to_western(2007, 'Winter', 1, 1)
+        with pytest.raises(ValueError):
+            cal.aturan_parts_to_western(2007, 'Thaw', 5, 1)
+        with pytest.raises(ValueError):
+            cal.aturan_parts_to_western(2007, 'Thaw', 1, 'Sunday')
+        with pytest.raises(ValueError):
+            cal.aturan_parts_to_western(2007, 9, 1, 'Felling')
+        with pytest.raises(ValueError):
+            cal.aturan_parts_to_western(2007, 9, 2, 1)
+
+
+def test_iter_aturan_range():
+    start = datetime.date(2005, 12, 30)
+    end = datetime.date(2010, 1, 2)
+    for step in (1, 7, 358, 359, 360, 800):
+        result = list(cal.iter_aturan_range(start, end, step))
+
+        expected = []
+        day = start
+        while day <= end:
+            expected.append(cal.western_to_aturan(day))
+            day += datetime.timedelta(days=step)
+        assert result == expected, 'wrong for step {}'.format(step)
+
+    assert list(cal.iter_aturan_range(end, start)) == []
+    assert list(cal.iter_aturan_range(arrow.get(2007, 3, 27), datetime.datetime(2007, 3, 27, 12))) == [
+        TestWesternToAturan.PUBLISHED]
+    with pytest.raises(ValueError):
+        next(cal.iter_aturan_range(start, end, 0))
+
+
+class TestAturanArithmetic:
+
+    def test_days(self):
+        start = cal.AturanDate(2007, 228)
+        for days in (-1000, -359, -1, 0, 1, 131, 132, 359, 5000):
+            expected = cal.western_to_aturan_date(start.to_western() + datetime.timedelta(days=days))
+            assert start + days == expected
+            assert days + start == expected
+            assert start - (-days) == expected
+            assert expected - start == days
+
+    def test_ordering(self):
+        assert cal.AturanDate(2007, 359) < cal.AturanDate(2008, 1)
+        assert cal.AturanDate(2008, 1) >= cal.AturanDate(2008, 1)
+        assert sorted([cal.AturanDate(2008, 2), cal.AturanDate(2007, 300), cal.AturanDate(2008, 1)]) == [
+            cal.AturanDate(2007, 300), cal.AturanDate(2008, 1), cal.AturanDate(2008, 2)]
+
+    def test_spans(self):
+        felling = cal.AturanDate(2007, 228)
+        assert felling.add_spans(3).as_dict() == {
+            'day_of_year': 261, 'month_of_year': 'Reaping', 'span_of_month': 4, 'day_of_span': 'Felling',
+            'day_of_month': 41, 'year': 2007,
+        }
+
+        # The last span of Dearth is followed by the first span of Thaw, skipping the High Mourning Holy Days.
+        last = cal.AturanDate(2007, 350)
+        assert last.add_spans(1) == cal.AturanDate(2008, 9)
+        assert last.add_spans(1).add_spans(-1) == last
+        assert felling.add_spans(32) == cal.AturanDate(2008, 228)
+        assert felling.add_spans(-64) == cal.AturanDate(2005, 228)
+
+        for spans in range(-40, 40):
+            result = felling.add_spans(spans)
+            assert result.day_of_span == 'Felling'
+            assert result.month_of_year is not None
+
+    def test_months(self):
+        start = cal.AturanDate(2010, 30)
+        assert start.add_months(5) == cal.AturanDate(2010, 250)
+        assert start.add_months(8) == cal.AturanDate(2011, 30)
+        assert start.add_months(7).add_months(1) == cal.AturanDate(2011, 30)
+        assert start.add_months(-1) == cal.AturanDate(2009, 338)
+        assert start.add_months(-1).day_of_month == start.day_of_month
+
+    def test_years(self):
+        assert cal.AturanDate(2010, 359).add_years(-3) == cal.AturanDate(2007, 359)
+
+    def test_holy_days_have_no_span_or_month(self):
+        with pytest.raises(ValueError):
+            cal.AturanDate(2010, 355).add_spans(1)
+        with pytest.raises(ValueError):
+            cal.AturanDate(2010, 355).add_months(1)
+
+
+class TestIterAturanDays:
+
+    def test_felling_in_reaping(self):
+        result = list(cal.iter_aturan_days(2010, 'Reaping', days='Felling'))
+
+        assert [day.span_of_month for day in result] == [1, 2, 3, 4]
+        assert all(day.month_of_year == 'Reaping' and day.day_of_span == 'Felling' for day in result)
+
+    def test_matches_full_scan(self):
+        patterns = [
+            {},
+            {'months': ['Thaw', 8], 'spans': 2},
+            {'spans': [1, 4], 'days': ['Luten', 11]},
+            {'months': 9},
+            {'months': '', 'days': [1, 7, 8]},
+            {'days': 'Mourning'},
+        ]
+        for pattern in patterns:
+            result = list(cal.iter_aturan_days(range(2009, 2011), **pattern))
+
+            expected = [
+                cal.AturanDate(year, doy)
+                for year in range(2009, 2011)
+                for doy in range(1, cal.ATURAN_DAYS_IN_YEAR + 1)
+                if (pattern.get('months') is None or
+                    cal.month_of_year(doy) in [cal.core._month_number(m) for m in
+                                               (pattern['months'] if isinstance(pattern['months'], list)
+                                                else [pattern['months']])])
+                and (pattern.get('spans') is None or
+                     cal.span_of_month(doy) in (pattern['spans'] if isinstance(pattern['spans'], list)
+                                                else [pattern['spans']]))
+                and (pattern.get('days') is None or
+                     cal.day_of_span(doy) in [cal.core._day_number(d) for d in
+                                              (pattern['days'] if isinstance(pattern['days'], list)
+                                               else [pattern['days']])])
+            ]
+            assert result == expected, pattern
+
+    def test_bad_pattern(self):
+        with pytest.raises(ValueError):
+            list(cal.iter_aturan_days(2010, 'Winter'))
+        with pytest.raises(ValueError):
+            list(cal.iter_aturan_days(2010, spans=5))
+        with pytest.raises(ValueError):
+            list(cal.iter_aturan_days(2010, days='Sunday'))
+
+
+class TestCalendar:
+
+    def test_default_origin_matches_module(self):
+        calendar = cal.Calendar()
+        assert calendar == cal.Calendar('2006-08-11')
+        assert calendar.origin == datetime.date(2006, 8, 11)
+
+        day = datetime.date(2005, 12, 1)
+        for _ in range(800):
+            assert calendar.western_to_aturan(day) == cal.western_to_aturan(day)
+            assert calendar.western_to_aturan_date(day) == cal.western_to_aturan_date(day)
+            day += datetime.timedelta(days=3)
+
+        assert calendar.aturan_to_western(2007, 228) == cal.aturan_to_western(2007, 228)
+        assert calendar.aturan_parts_to_western(2007, 'Reaping', 1, 'Felling') == datetime.date(2007, 3, 27)
+        assert calendar.aturan_year_bounds(2010) == cal.aturan_year_bounds(2010)
+        assert calendar.aturan_years_for_western_year(1811) == cal.aturan_years_for_western_year(1811)
+        assert calendar.aturan_calendar_for_western_year(2016) == cal.aturan_calendar_for_western_year(2016)
+        assert dict(calendar.western_year_calendar(2016)) == dict(cal.western_year_calendar(2016))
+        assert list(calendar.iter_aturan_range('2016-01-01', '2017-01-01', 7)) == list(
+            cal.iter_aturan_range('2016-01-01', '2017-01-01', 7))
+
+    def test_other_origin(self):
+        # One Aturan year and 100 days later.
+        calendar = cal.Calendar(datetime.date(2006, 8, 11) + datetime.timedelta(days=cal.ATURAN_DAYS_IN_YEAR + 100))
+        assert calendar.first_year == 2008
+
+        day = datetime.date(2007, 1, 1)
+        for _ in range(1000):
+            shifted = cal.western_to_aturan_date(day - datetime.timedelta(days=cal.ATURAN_DAYS_IN_YEAR + 100))
+            expected = cal.AturanDate(shifted.year + 1, shifted.day_of_year)
+            assert calendar.western_to_aturan_date(day) == expected
+            assert calendar.aturan_to_western(expected.year, expected.day_of_year) == day
+            day += datetime.timedelta(days=1)
+
+        assert calendar.western_to_aturan_date(datetime.date(2007, 11, 14)) == cal.AturanDate(2008, 1)
+        assert calendar.aturan_year_bounds(2008)[0] == datetime.date(2007, 11, 14)
+        for year, first, last in calendar.western_year_calendar(2016).segments():
+            assert calendar.western_to_aturan_date(datetime.date(2016, 1, 1) + datetime.timedelta(days=first - 1)) \
+                == cal.AturanDate(year, calendar.western_year_calendar(2016)[first].day_of_year)
+            assert calendar.aturan_years_for_western_year(2016).count(year) == 1
+
+    def test_calendars_coexist(self):
+        day = datetime.date(2016, 4, 14)
+        calendars = [cal.Calendar(datetime.date(2006, 8, 11) + datetime.timedelta(days=n)) for n in range(0, 50, 7)]
+        results = [calendar.western_to_aturan_date(day) for calendar in calendars]
+
+        assert len(set(results)) == len(calendars)
+        assert cal.western_to_aturan_date(day) == results[0]
+
+    def test_immutable(self):
+        calendar = cal.Calendar('2001-01-01')
+        with pytest.raises(AttributeError):
+            calendar.origin_ordinal = 0
+        assert pickle.loads(pickle.dumps(calendar)) == calendar
+        assert repr(calendar) == 'Calendar(origin=datetime.date(2001, 1, 1))'
+        assert len({calendar, cal.Calendar('2001-01-01'), cal.Calendar()}) == 2
@@ -0,0 +1,86 @@
+import csv
+import datetime
+import io
+import json
+
+import pytest
+
+import aturan_calendar as cal
+from aturan_calendar import cli
+
+
+def test_csv_output():
+    out = io.StringIO()
+
+    count = cli.convert_stream(['2007-03-27', '2016-04-14T23:00:00', '2016-03-31'], out)
+
+    assert count == 3
+    assert out.getvalue().splitlines() == [
+        'date,day_of_year,month_of_year,span_of_month,day_of_span,day_of_month,year',
+        '2007-03-27,228,Reaping,1,Felling,8,2007',
+        '2016-04-14T23:00:00,303,Fallow,4,Hepten,39,2016',
+        '2016-03-31,289,Fallow,3,Theden,25,2016',
+    ]
+
+
+def test_csv_output_quotes_dates():
+    out = io.StringIO()
+
+    cli.convert_stream(['2016-04-14T08:00:00,5', '2016-04-14'], out)
+
+    rows = list(csv.reader(io.StringIO(out.getvalue())))
+    assert rows[1] == ['2016-04-14T08:00:00,5', '303', 'Fallow', '4', 'Hepten', '39', '2016']
+    assert rows[2] == ['2016-04-14', '303', 'Fallow', '4', 'Hepten', '39', '2016']
+    assert out.getvalue().splitlines()[2] == '2016-04-14,303,Fallow,4,Hepten,39,2016'
+
+
+def test_jsonl_output_matches_western_to_aturan():
+    start = datetime.date(2015, 1, 1)
+    dates = [start + datetime.timedelta(days=i) for i in range(800)]
+    out = io.StringIO()
+
+    cli.convert_stream([day.isoformat() for day in dates], out, fmt='jsonl')
+
+    lines = out.getvalue().splitlines()
+    assert len(lines) == len(dates)
+    for day, line in zip(dates, lines):
+        expected = cal.western_to_aturan(day)
+        expected['date'] = day.isoformat()
+        assert json.loads(line) == expected
+
+
+def test_invalid_dates():
+    with pytest.raises(ValueError):
+        cli.convert_stream(['2007-03-27', 'yesterday'], io.StringIO())
+
+    out = io.StringIO()
+    errors = io.StringIO()
+    assert cli.convert_stream(['2007-03-27', 'yesterday'], out, skip_invalid=True, errors=errors) == 1
+    assert 'yesterday' in errors.getvalue()
+
+
+def test_main_with_csv_column(tmp_path, capsys):
+    path = tmp_path / 'events.csv'
+    path.write_text('id,created_at\n1,2007-03-27\n2,\n3,2016-04-14\n')
+
+    assert cli.main(['--column', 'created_at', str(path)]) == 0
+    assert capsys.readouterr().out.splitlines()[1:] == [
+        '2007-03-27,228,Reaping,1,Felling,8,2007',
+        '2016-04-14,303,Fallow,4,Hepten,39,2016',
+    ]
+
+    headerless = tmp_path / 'events-no-header.csv'
+    headerless.write_text('1,2007-03-27\n3,2016-04-14\n')
+    output = tmp_path / 'out.jsonl'
+    assert cli.main(['--column', '1', '--format', 'jsonl', '--output', str(output), str(headerless)]) == 0
+    assert [json.loads(line)['day_of_year'] for line in output.read_text().splitlines()] == [228, 303]
+
+
+def test_main_invalid_date(tmp_path, capsys):
+    path = tmp_path / 'dates.txt'
+    path.write_text('2007-03-27\nnope\n')
+
+    with pytest.raises(SystemExit) as e:
+        cli.main([str(path)])
+    assert e.value.code == 1
+    assert "invalid date 'nope'" in capsys.readouterr().err
@@ -0,0 +1,73 @@
+import datetime
+import json
+
+import pytest
+
+import aturan_calendar as cal
+from aturan_calendar import encoding
+
+
+def _dates():
+    return list(cal.iter_aturan_range(datetime.date(2006, 1, 1), datetime.date(2008, 12, 31)))
+
+
+def test_int_round_trip():
+    dates = _dates() + [cal.AturanDate(-40, 359), cal.AturanDate(0, 1)]
+    packed = [encoding.to_int(date) for date in dates]
+
+    assert [encoding.from_int(value) for value in packed] == dates
+    assert sorted(packed) == [encoding.to_int(date) for date in sorted(dates)]
+    assert encoding.to_int(cal.AturanDate(2007, 228)) == (2007 << 9) | 228
+    assert encoding.to_int(cal.western_to_aturan(datetime.date(2007, 3, 27))) == (2007 << 9) | 228
+
+
+def test_bytes_round_trip():
+    dates = _dates()
+    data = encoding.to_bytes(dates)
+
+    assert len(data) == 4 * len(dates)
+    assert encoding.from_bytes(data) == dates
+    assert encoding.to_bytes([]) == b''
+    assert encoding.from_bytes(b'') == []
+    with pytest.raises(ValueError):
+        encoding.from_bytes(data[:-1])
+
+
+def test_json_matches_json_dumps():
+    for date in _dates():
+        entry = cal.western_to_aturan(date.to_western())
+        text = json.dumps(entry)
+
+        assert encoding.to_json(date) == text
+        assert encoding.to_json(entry) == text
+        assert encoding.western_to_json(date.to_western()) == text
+        assert encoding.from_json(text) == date
+
+
+def test_western_to_json_inputs():
+    assert encoding.western_to_json('2016-04-14') == json.dumps(cal.western_to_aturan('2016-04-14'))
+    assert encoding.western_to_json(16905, epoch_unit='days') == json.dumps(cal.western_to_aturan(16905, 'days'))
+    assert encoding.western_to_json(1460606400, tz='America/New_York') == json.dumps(
+        cal.western_to_aturan(1460606400, tz='America/New_York'))
+    with pytest.raises(TypeError):
+        encoding.western_to_json(None)
+
+
+def test_json_array():
+    dates = _dates()[:20]
+    text = encoding.to_json_array(dates)
+
+    assert json.loads(text) == [dict(date) for date in dates]
+    assert encoding.from_json(text) == dates
+    assert encoding.to_json_array([]) == '[]'
+
+
+def test_bad_day_of_year():
+    with pytest.raises(ValueError):
+        encoding.to_json({'year': 2016, 'day_of_year': 360})
+    with pytest.raises(ValueError):
+        encoding.from_int(2016 << 9)
+    for encode in (encoding.to_int, lambda date: encoding.to_bytes([date])):
+        for doy in (0, 600):
+            with pytest.raises(ValueError):
+                encode({'year': 2016, 'day_of_year': doy})
@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+
+import aturan_calendar
+from aturan_calendar import core
+
+# Generous budget for `import aturan_calendar` alone, cumulative as reported by `python -X importtime`.
+IMPORT_BUDGET_US = 50000
+
+
+def _run(*args):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    return subprocess.run([sys.executable] + list(args), env=env, check=True, capture_output=True, text=True)
+
+
+def test_import_skips_optional_modules():
+    result = _run('-c', 'import sys, aturan_calendar; print(" ".join(sorted(sys.modules)))')
+    loaded = result.stdout.split()
+
+    for module in ('arrow', 'dateutil', 'numpy', 'asyncio', 'concurrent.futures'):
+        assert module not in loaded
+
+
+def test_import_time():
+    result = _run('-X', 'importtime', '-c', 'import aturan_calendar')
+
+    cumulative = None
+    for line in result.stderr.splitlines():
+        _, _, timings = line.partition('import time:')
+        fields = [field.strip() for field in timings.split('|')]
+        if fields[-1] == 'aturan_calendar':
+            cumulative = int(fields[1])
+    assert cumulative is not None
+    assert cumulative < IMPORT_BUDGET_US, 'import aturan_calendar took {}us'.format(cumulative)
+
+
+def test_arrow_still_works_when_imported_later():
+    code = '\n'.join([
+        'import aturan_calendar, arrow',
+        'assert aturan_calendar.western_to_aturan(arrow.get(2007, 3, 27))["day_of_year"] == 228',
+        'assert aturan_calendar._ORIGIN == arrow.get(2006, 8, 11)',
+    ])
+    _run('-c', code)
+
+
+def test_public_names_only():
+    for name in core.__all__:
+        assert getattr(aturan_calendar, name) is getattr(core, name)
+    for name in ('array', 'collections', 'datetime', 'sys'):
+        assert not hasattr(aturan_calendar, name)
@@ -0,0 +1,89 @@
+import datetime
+import os
+import subprocess
+import sys
+
+import pytest
+
+import aturan_calendar as cal
+from aturan_calendar import core, instrumentation
+
+
+@pytest.fixture
+def instrumented():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_disabled_by_default():
+    assert not instrumentation.is_enabled()
+    assert not hasattr(core._normalize_date, '__wrapped__')
+
+
+def test_counts_stages(instrumented):
+    for _ in range(3):
+        cal.western_to_aturan(datetime.date(2016, 4, 14))
+    cal.western_to_aturan('2016-04-14')
+    cal.western_to_aturan_date(1460641020)
+    cal.western_to_aturan_date(1460641020, tz='America/New_York')
+    # Making the calendar normalizes its origin as well.
+    cal.Calendar('2001-01-01').western_to_aturan(datetime.datetime(2016, 4, 14, 13, 37))
+
+    stats = instrumentation.stats()
+    assert {name: value['calls'] for name, value in stats.items()} == {
+        'normalize_date[date]': 3,
+        'normalize_date[str]': 2,
+        'normalize_date[int]': 1,
+        'normalize_date[datetime]': 1,
+        'local_ordinal[int]': 1,
+        'ordinal_to_aturan': 5,
+        'ordinal_to_date': 2,
+    }
+    assert all(value['seconds'] >= 0 for value in stats.values())
+
+
+def test_enable_loads_time_zones_lazily():
+    code = '\n'.join([
+        'import sys',
+        'from aturan_calendar import core, instrumentation',
+        'instrumentation.enable()',
+        'assert "zoneinfo" not in sys.modules',
+        'assert core.western_to_aturan_date(0, tz="UTC") == core.western_to_aturan_date(0)',
+        'assert instrumentation.stats()["local_ordinal[int]"]["calls"] == 1',
+    ])
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    subprocess.run([sys.executable, '-c', code], env=env, check=True)
+
+
+def test_disable_restores(instrumented):
+    cal.western_to_aturan(datetime.date(2016, 4, 14))
+    instrumentation.disable()
+
+    assert not instrumentation.is_enabled()
+    assert not hasattr(core._normalize_date, '__wrapped__')
+    cal.western_to_aturan(datetime.date(2016, 4, 14))
+    assert instrumentation.stats()['normalize_date[date]']['calls'] == 1
+
+    instrumentation.reset()
+    assert instrumentation.stats() == {}
+
+
+def test_errors_are_counted(instrumented):
+    with pytest.raises(TypeError):
+        cal.western_to_aturan(None)
+    assert instrumentation.stats()['normalize_date[NoneType]']['calls'] == 1
+
+
+def test_prometheus_text(instrumented):
+    cal.western_to_aturan('2016-04-14')
+    cal.western_to_aturan(datetime.date(2016, 4, 14))
+
+    lines = instrumentation.prometheus_text().splitlines()
+    assert '# TYPE aturan_calendar_stage_calls_total counter' in lines
+    assert '# TYPE aturan_calendar_stage_seconds_total counter' in lines
+    assert 'aturan_calendar_stage_calls_total{stage="normalize_date",input="str"} 1' in lines
+    assert 'aturan_calendar_stage_calls_total{stage="ordinal_to_aturan"} 2' in lines
+    assert len([line for line in lines if line.startswith('aturan_calendar_stage_seconds_total{')]) == 3
@@ -0,0 +1,73 @@
+import datetime
+
+import pytest
+
+import aturan_calendar as cal
+
+pd = pytest.importorskip('pandas')
+import aturan_calendar.pandas_accessor  # noqa: E402
+
+
+def _series():
+    start = datetime.date(2015, 6, 1)
+    days = [start + datetime.timedelta(days=i) for i in range(800)]
+    return pd.Series(pd.to_datetime(days) + pd.Timedelta(hours=13), index=range(100, 900), name='date'), days
+
+
+def test_fields_match_western_to_aturan():
+    series, days = _series()
+
+    frame = series.aturan.to_frame()
+
+    assert list(frame.columns) == ['day_of_year', 'month_of_year', 'span_of_month', 'day_of_span', 'day_of_month',
+                                   'year']
+    assert list(frame.index) == list(series.index)
+    for day, (_, row) in zip(days, frame.iterrows()):
+        expected = cal.western_to_aturan(day)
+        actual = {key: (None if pd.isna(value) else value) for key, value in row.items()}
+        assert actual == expected, 'wrong for {}'.format(day)
+
+
+def test_dtypes():
+    series, _ = _series()
+
+    assert series.aturan.month_of_year.dtype == aturan_calendar.pandas_accessor.MONTH_CATEGORIES
+    assert list(series.aturan.month_of_year.cat.categories[:2]) == ['Thaw', 'Equis']
+    assert series.aturan.day_of_span.cat.ordered
+    assert str(series.aturan.year.dtype) == 'Int64'
+    assert series.aturan.day_of_month.name == 'day_of_month'
+
+
+def test_missing_and_time_zones():
+    series = pd.Series([pd.Timestamp('2007-03-27 23:30', tz='Asia/Tokyo'), pd.NaT],
+                       dtype='datetime64[ns, Asia/Tokyo]')
+
+    assert series.aturan.day_of_year.tolist()[0] == 228
+    assert series.aturan.day_of_span.tolist()[0] == 'Felling'
+    assert series.aturan.year.isna().tolist() == [False, True]
+    assert series.aturan.month_of_year.isna().tolist() == [False, True]
+    assert series.aturan.day_of_span.isna().tolist() == [False, True]
+
+
+def test_outside_nanosecond_range():
+    np = pytest.importorskip('numpy')
+    series = pd.Series(np.array(['1500-01-01', '2500-01-01', 'NaT'], dtype='datetime64[s]'))
+
+    assert series.aturan.year.tolist()[:2] == [cal.western_to_aturan(datetime.date(1500, 1, 1))['year'],
+                                               cal.western_to_aturan(datetime.date(2500, 1, 1))['year']]
+    assert series.aturan.day_of_year.tolist()[:2] == [cal.western_to_aturan(datetime.date(1500, 1, 1))['day_of_year'],
+                                                      cal.western_to_aturan(datetime.date(2500, 1, 1))['day_of_year']]
+    assert series.aturan.year.isna().tolist() == [False, False, True]
+
+
+def test_holy_days():
+    series = pd.Series(pd.to_datetime([cal.aturan_to_western(2016, 353), cal.aturan_to_western(2016, 359)]))
+
+    assert series.aturan.month_of_year.isna().all()
+    assert series.aturan.span_of_month.isna().all()
+    assert series.aturan.day_of_span.tolist() == ['High Mourning Day #1', 'High Mourning Day #7 (Winter\'s Solstice)']
+
+
+def test_not_datetime():
+    with pytest.raises(AttributeError):
+        pd.Series([1, 2, 3]).aturan
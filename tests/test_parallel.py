@@ -0,0 +1,91 @@
+import concurrent.futures
+import datetime
+
+import pytest
+
+import aturan_calendar as cal
+
+
+def _dates(count):
+    start = datetime.date(1990, 1, 1)
+    return [start + datetime.timedelta(days=i) for i in range(count)]
+
+
+def test_convert_parallel_keeps_order():
+    dates = _dates(5000)
+
+    result = cal.convert_parallel(dates, max_workers=2, chunksize=700)
+
+    assert result == [cal.western_to_aturan_date(day) for day in dates]
+
+
+def test_convert_parallel_single_chunk_and_empty():
+    dates = _dates(10)
+    assert cal.convert_parallel(dates) == [cal.western_to_aturan_date(day) for day in dates]
+    assert cal.convert_parallel([]) == []
+
+
+def test_convert_parallel_with_executor():
+    dates = _dates(1000)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+        result = cal.convert_parallel(dates, chunksize=128, executor=executor)
+    assert result == [cal.western_to_aturan_date(day) for day in dates]
+
+
+def test_convert_parallel_other_inputs():
+    dates = _dates(3000)
+    values = [day.isoformat() if idx % 3 else day for idx, day in enumerate(dates)]
+    expected = [cal.western_to_aturan_date(day) for day in dates]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        assert cal.convert_parallel(values, chunksize=500, executor=executor) == expected
+        assert cal.convert_parallel(iter(dates), chunksize=500, executor=executor) == expected
+
+        stamps = [datetime.datetime(day.year, day.month, day.day, 2, tzinfo=datetime.timezone.utc) for day in dates]
+        result = cal.convert_parallel(stamps, chunksize=500, executor=executor, tz='America/New_York')
+        assert result == [cal.western_to_aturan_date(stamp, tz='America/New_York') for stamp in stamps]
+
+
+def test_converted_dates():
+    dates = _dates(100)
+    result = cal.convert_parallel(dates, chunksize=30, max_workers=2)
+
+    assert isinstance(result, cal.ConvertedDates)
+    assert len(result) == 100
+    assert result[5] == cal.western_to_aturan_date(dates[5])
+    assert result[-1] == cal.western_to_aturan_date(dates[-1])
+    assert list(result[10:20]) == [cal.western_to_aturan_date(day) for day in dates[10:20]]
+    assert list(result.years) == [date.year for date in result]
+    assert list(result.days_of_year) == [date.day_of_year for date in result]
+    assert result != result[1:]
+
+
+def test_convert_parallel_numpy():
+    np = pytest.importorskip('numpy')
+    dates = np.arange(np.datetime64('1900-01-01'), np.datetime64('2100-01-01'))
+
+    result = cal.convert_parallel(dates, max_workers=2, chunksize=10000)
+    expected = cal.western_to_aturan_array(dates)
+
+    assert set(result) == set(expected)
+    for key in expected:
+        assert (result[key] == expected[key]).all(), key
+
+
+def test_convert_parallel_numpy_in_workers():
+    np = pytest.importorskip('numpy')
+    dates = np.arange(np.datetime64('2015-01-01T13:00'), np.datetime64('2017-01-01T13:00'), np.timedelta64(1, 'D'))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        result = cal.convert_parallel(dates, chunksize=100, executor=executor, tz='Asia/Tokyo')
+        with pytest.raises(ValueError):
+            cal.convert_parallel(np.append(dates, np.datetime64('NaT')), chunksize=100, executor=executor)
+    expected = cal.western_to_aturan_array(dates, tz='Asia/Tokyo')
+
+    for key in expected:
+        assert (result[key] == expected[key]).all(), key
+
+
+def test_convert_parallel_bad_chunksize():
+    with pytest.raises(ValueError):
+        cal.convert_parallel(_dates(10), chunksize=0)
@@ -0,0 +1,91 @@
+import datetime
+import re
+
+import pytest
+
+import aturan_calendar as cal
+from aturan_calendar import render
+
+
+def test_text_month():
+    result = render.text_month(2007, 'Reaping').splitlines()
+
+    assert result[0].strip() == 'Reaping 2007'
+    assert result[1].split() == [cal.ATURAN_DAY_NAMES[day] for day in range(1, 12)]
+    assert len(result) == 6
+    # 27-Mar-2007 is Felling, the 8th day of the first span of Reaping.
+    assert result[2].split()[14:16] == ['8', '03-27']
+    assert result[5].split()[-2:] == ['44', '05-02']
+    assert render.text_month(2007, 6) == render.text_month(2007, 'Reaping')
+
+
+def test_text_holy_days():
+    result = render.text_month(2007, '').splitlines()
+
+    assert result[0].strip() == 'High Mourning 2007'
+    assert len(result) == 8
+    assert result[-1].startswith("High Mourning Day #7 (Winter's Solstice)")
+    assert result[-1].endswith('2007-08-05')
+
+
+def test_text_year_dates():
+    for year in (1, 2007, 2016):
+        result = render.text_year(year)
+        assert result.splitlines()[0].strip() == str(year)
+
+        dates = re.findall(r'(?<= )\d\d-\d\d|\d{4}-\d\d-\d\d', result)
+        assert len(dates) == cal.ATURAN_DAYS_IN_YEAR
+        for doy, text in enumerate(dates, 1):
+            assert cal.aturan_to_western(year, doy).isoformat().endswith(text)
+
+
+def test_html_month():
+    result = render.html_month(2007, 'Reaping')
+
+    assert result.startswith('<table class="month reaping">')
+    assert 'Reaping 2007' in result
+    assert result.count('<tr class="span">') == 4
+    assert '<td class="felling"><span class="day">8</span> <time datetime="2007-03-27">03-27</time></td>' in result
+
+
+def test_html_year():
+    result = render.html_year(2016)
+
+    assert '<h1 class="year">2016</h1>' in result
+    assert result.count('<table') == 9
+    assert 'Winter&#x27;s Solstice' in result
+    dates = re.findall(r'datetime="([\d-]+)"', result)
+    assert dates == [cal.aturan_to_western(2016, doy).isoformat() for doy in range(1, cal.ATURAN_DAYS_IN_YEAR + 1)]
+
+
+def test_bad_month():
+    with pytest.raises(ValueError):
+        render.text_month(2007, 'Winter')
+    with pytest.raises(ValueError):
+        render.html_month(2007, 10)
+
+
+def test_holy_days_ics():
+    result = render.holy_days_ics([2007, 2008], stamp=datetime.datetime(2020, 1, 2, 3, 4, 5))
+
+    assert result.startswith('BEGIN:VCALENDAR\r\n')
+    assert result.endswith('END:VCALENDAR\r\n')
+    assert '\n' not in result.replace('\r\n', '')
+    assert result.count('BEGIN:VEVENT') == 14
+    assert result.count('DTSTAMP:20200102T030405Z') == 14
+
+    starts = re.findall(r'DTSTART;VALUE=DATE:(\d{8})', result)
+    ends = re.findall(r'DTEND;VALUE=DATE:(\d{8})', result)
+    expected = [cal.aturan_to_western(year, doy) for year in (2007, 2008) for doy in range(353, 360)]
+    assert starts == [day.strftime('%Y%m%d') for day in expected]
+    assert ends == [(day + datetime.timedelta(days=1)).strftime('%Y%m%d') for day in expected]
+    assert 'UID:aturan-2008-359@aturan-calendar' in result
+    assert "SUMMARY:High Mourning Day #7 (Winter's Solstice)" in result
+
+
+def test_holy_days_ics_single_year():
+    stamp = datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=datetime.timezone(datetime.timedelta(hours=-5)))
+    result = render.holy_days_ics(2007, stamp=stamp)
+
+    assert result.count('BEGIN:VEVENT') == 7
+    assert 'DTSTAMP:20200102T080405Z' in result
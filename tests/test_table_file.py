@@ -0,0 +1,88 @@
+import datetime
+import struct
+
+import pytest
+
+import aturan_calendar as cal
+
+
+@pytest.fixture
+def table_path(tmp_path):
+    path = str(tmp_path / 'aturan.bin')
+    cal.write_table(path, datetime.date(2005, 1, 1), datetime.date(2012, 12, 31))
+    return path
+
+
+def test_lookup_matches_conversion(table_path):
+    with cal.ConversionTable(table_path) as table:
+        assert table.start == datetime.date(2005, 1, 1)
+        assert table.end == datetime.date(2012, 12, 31)
+
+        day = table.start
+        while day <= table.end:
+            result = table.lookup(day)
+            assert result == cal.western_to_aturan(day), 'wrong for {}'.format(day)
+
+            year, doy, month, span, dos, dom = table.record(day)
+            assert (year, doy) == (result.year, result.day_of_year)
+            assert span == (result.span_of_month or 0)
+            assert dom == (result.day_of_month or 0)
+            assert dos == cal.day_of_span(doy)
+            assert month == (0 if result.month_of_year is None else cal.month_of_year(doy))
+            day += datetime.timedelta(days=1)
+
+
+def test_lookup_out_of_range(table_path):
+    with cal.ConversionTable(table_path) as table:
+        with pytest.raises(KeyError):
+            table.lookup(datetime.date(2004, 12, 31))
+        with pytest.raises(KeyError):
+            table.lookup(datetime.date(2013, 1, 1))
+
+
+def test_lookup_by_ordinal(table_path):
+    with cal.ConversionTable(table_path) as table:
+        for day in (table.start, datetime.date(2007, 3, 27), table.end):
+            assert table.lookup_ordinal(day.toordinal()) == table.lookup(day)
+            assert table.record_ordinal(day.toordinal()) == table.record(day)
+
+        with pytest.raises(KeyError):
+            table.lookup_ordinal(table.first_ordinal - 1)
+        with pytest.raises(KeyError):
+            table.record_ordinal(table.first_ordinal + len(table))
+        # Integers passed to lookup are Unix timestamps, not ordinals.
+        with pytest.raises(KeyError):
+            table.lookup(datetime.date(2007, 3, 27).toordinal())
+
+
+def test_rejects_other_files(tmp_path):
+    path = str(tmp_path / 'other.bin')
+    with open(path, 'wb') as f:
+        f.write(b'\0' * 64)
+    with pytest.raises(ValueError):
+        cal.ConversionTable(path)
+
+
+def test_rejects_truncated_files(table_path, tmp_path):
+    with open(table_path, 'rb') as f:
+        data = f.read()
+
+    for size in (10, len(data) - 1):
+        path = str(tmp_path / 'truncated-{}.bin'.format(size))
+        with open(path, 'wb') as f:
+            f.write(data[:size])
+        with pytest.raises(ValueError):
+            cal.ConversionTable(path)
+
+
+def test_rejects_other_origin(table_path):
+    with open(table_path, 'r+b') as f:
+        f.seek(12)
+        f.write(struct.pack('<i', 1))
+    with pytest.raises(ValueError):
+        cal.ConversionTable(table_path)
+
+
+def test_bad_range(tmp_path):
+    with pytest.raises(ValueError):
+        cal.write_table(str(tmp_path / 'aturan.bin'), datetime.date(2010, 1, 1), datetime.date(2009, 1, 1))
@@ -0,0 +1,104 @@
+import datetime
+import random
+import zoneinfo
+
+import arrow
+import pytest
+
+import aturan_calendar as cal
+from aturan_calendar import timezones
+
+ZONES = ['America/New_York', 'Asia/Kolkata', 'Australia/Lord_Howe', 'Europe/London', 'Pacific/Apia', 'UTC']
+
+
+def _expected(seconds, zone):
+    local = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc) + datetime.timedelta(seconds=seconds)
+    return cal.western_to_aturan(local.astimezone(zoneinfo.ZoneInfo(zone)).date())
+
+
+@pytest.mark.parametrize('zone', ZONES)
+def test_random_timestamps(zone):
+    rng = random.Random(zone)
+    low = int(datetime.datetime(1960, 1, 1, tzinfo=datetime.timezone.utc).timestamp())
+    high = int(datetime.datetime(2060, 1, 1, tzinfo=datetime.timezone.utc).timestamp())
+    for _ in range(1000):
+        seconds = rng.randrange(low, high)
+        assert cal.western_to_aturan(seconds, tz=zone) == _expected(seconds, zone), seconds
+
+
+@pytest.mark.parametrize('zone', ZONES)
+def test_around_transitions(zone):
+    table = timezones.transition_table(zone)
+    start = int(datetime.datetime(2015, 1, 1, tzinfo=datetime.timezone.utc).timestamp())
+    for number in range(start // timezones._CHUNK_SECONDS, start // timezones._CHUNK_SECONDS + 3):
+        starts, offsets = table.chunk(number)
+        for transition in starts[1:]:
+            for seconds in (transition - 1, transition, transition + 1):
+                assert cal.western_to_aturan(seconds, tz=zone) == _expected(seconds, zone), seconds
+
+
+def test_near_midnight_utc():
+    # 23:30 UTC on the 26th of March is already the 27th in Tokyo and still the 26th in Los Angeles.
+    late = datetime.datetime(2007, 3, 26, 23, 30, tzinfo=datetime.timezone.utc)
+    assert cal.western_to_aturan(late.timestamp(), tz='Asia/Tokyo')['day_of_year'] == 228
+    assert cal.western_to_aturan(late.timestamp(), tz='America/Los_Angeles')['day_of_year'] == 227
+    assert cal.western_to_aturan(late, tz='Asia/Tokyo')['day_of_year'] == 228
+    assert cal.western_to_aturan(late.replace(tzinfo=None), tz='Asia/Tokyo')['day_of_year'] == 228
+    assert cal.western_to_aturan(arrow.get(late), tz='Asia/Tokyo')['day_of_year'] == 228
+    assert cal.western_to_aturan('2007-03-26T23:30:00+00:00', tz='Asia/Tokyo')['day_of_year'] == 228
+    assert cal.western_to_aturan_date(late, tz=zoneinfo.ZoneInfo('Asia/Tokyo')).day_of_year == 228
+
+    # Without a time zone the date part is used as it is.
+    assert cal.western_to_aturan(late)['day_of_year'] == 227
+
+
+def test_dates_are_unchanged():
+    assert cal.western_to_aturan(datetime.date(2007, 3, 27), tz='Asia/Tokyo')['day_of_year'] == 228
+    assert cal.western_to_aturan('2007-03-27', tz='America/Los_Angeles')['day_of_year'] == 228
+    days = (datetime.date(2007, 3, 27) - datetime.date(1970, 1, 1)).days
+    assert cal.western_to_aturan(days, epoch_unit='days', tz='Asia/Tokyo')['day_of_year'] == 228
+
+
+@pytest.mark.parametrize('zone', ZONES)
+def test_edges_of_datetime_range(zone):
+    for value in (datetime.datetime(1, 1, 2, 12), datetime.datetime(1, 1, 3), datetime.datetime(9999, 6, 1),
+                  datetime.datetime(9999, 12, 29, 12)):
+        local = value.replace(tzinfo=datetime.timezone.utc).astimezone(zoneinfo.ZoneInfo(zone))
+        assert cal.western_to_aturan(value, tz=zone) == cal.western_to_aturan(local.date()), value
+
+
+def test_array_missing():
+    np = pytest.importorskip('numpy')
+    seconds = np.array(['2007-03-27T03:00', 'NaT', '2007-03-27T05:00'], dtype='datetime64[s]').astype(np.int64)
+
+    result = timezones.local_days(seconds, 'America/New_York')
+
+    assert result.tolist() == [datetime.date(2007, 3, 26).toordinal(), seconds[1], datetime.date(2007, 3, 27).toordinal()]
+    assert timezones.local_days(seconds[1:2], 'America/New_York').tolist() == [seconds[1]]
+
+
+def test_bad_zone():
+    with pytest.raises(TypeError):
+        cal.western_to_aturan(0, tz=5)
+    with pytest.raises(zoneinfo.ZoneInfoNotFoundError):
+        cal.western_to_aturan(0, tz='Mars/Olympus_Mons')
+
+
+@pytest.mark.parametrize('zone', ZONES)
+def test_array(zone):
+    np = pytest.importorskip('numpy')
+    rng = np.random.default_rng(7)
+    seconds = rng.integers(-500000000, 2500000000, size=5000)
+
+    result = cal.western_to_aturan_array(seconds.astype('datetime64[s]'), tz=zone)
+
+    for idx in range(0, len(seconds), 50):
+        expected = _expected(int(seconds[idx]), zone)
+        assert (int(result['year'][idx]), int(result['day_of_year'][idx])) == (expected['year'],
+                                                                               expected['day_of_year'])
+
+
+def test_parallel():
+    late = datetime.datetime(2007, 3, 26, 23, 30, tzinfo=datetime.timezone.utc)
+    result = cal.convert_parallel([late, late.timestamp()], tz='Asia/Tokyo')
+    assert [date.day_of_year for date in result] == [228, 228]